@@ -2,26 +2,38 @@
 Agents Package
 ==============
 6 specialized AI agents + orchestrator for the Agentic AI Content Studio.
+
+Agents are imported lazily on first attribute access (PEP 562), so
+`from agents import BrandVoiceAgent` does not pull in every other agent
+and its dependencies.
 """
 
-from agents.base_agent import BaseAgent
-from agents.input_processor_agent import InputProcessorAgent
-from agents.research_agent import ResearchAgent
-from agents.content_intelligence_agent import ContentIntelligenceAgent
-from agents.generation_agent import GenerationAgent
-from agents.brand_voice_agent import BrandVoiceAgent
-from agents.optimization_agent import OptimizationAgent
-from agents.agent_orchestrator import AgentOrchestrator
-from agents.linkedin_posting_agent import LinkedInPostingAgent
-
-__all__ = [
-    "BaseAgent",
-    "InputProcessorAgent",
-    "ResearchAgent",
-    "ContentIntelligenceAgent",
-    "GenerationAgent",
-    "BrandVoiceAgent",
-    "OptimizationAgent",
-    "AgentOrchestrator",
-    "LinkedInPostingAgent",
-]
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "BaseAgent":                "base_agent",
+    "InputProcessorAgent":      "input_processor_agent",
+    "ResearchAgent":            "research_agent",
+    "ContentIntelligenceAgent": "content_intelligence_agent",
+    "GenerationAgent":          "generation_agent",
+    "BrandVoiceAgent":          "brand_voice_agent",
+    "OptimizationAgent":        "optimization_agent",
+    "AgentOrchestrator":        "agent_orchestrator",
+    "LinkedInPostingAgent":     "linkedin_posting_agent",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,7 +1,9 @@
 """
 Agent Orchestrator
 ==================
-Coordinates all 6 agents in sequence, passing context between them.
+Coordinates all 6 agents, passing context between them.
+Agents are scheduled by data dependency: every agent whose inputs are
+ready runs in the same wave, concurrently.
 Provides real-time status callbacks for UI visualization.
 
 Workflow:
@@ -9,11 +11,14 @@ Workflow:
 """
 
 import logging
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
-from agents.base_agent import AgentResult
+from agents.base_agent import AGENT_DEADLINE, PARTIAL_OUTPUT, AgentResult, BaseAgent
 from agents.input_processor_agent import InputProcessorAgent
 from agents.research_agent import ResearchAgent
 from agents.content_intelligence_agent import ContentIntelligenceAgent
@@ -24,7 +29,7 @@ from agents.optimization_agent import OptimizationAgent
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStatus:
     """Real-time status update for UI."""
     agent_name: str
@@ -32,9 +37,10 @@ class WorkflowStatus:
     message: str = ""
     progress: float = 0.0  # 0-1
     elapsed: float = 0.0
+    partial_content: str = ""  # LLM text streamed so far (while "running")
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class OrchestratorResult:
     """Final result from the entire agentic workflow."""
     success: bool
@@ -43,27 +49,79 @@ class OrchestratorResult:
     hashtags: str = ""
     strategy: Dict = field(default_factory=dict)
     # Intelligence outputs
-    research: Dict = field(default_factory=dict)
-    brand_feedback: Dict = field(default_factory=dict)
-    optimization: Dict = field(default_factory=dict)
     overall_recommendations: List[str] = field(default_factory=list)
     best_variant: str = "storyteller"
     # Metadata
     total_time: float = 0.0
     agents_run: List[str] = field(default_factory=list)
     error_message: str = ""
+    # Merged workflow context; research / brand_feedback / optimization are
+    # read from it on first access instead of being copied out eagerly
+    _context: Dict[str, Any] = field(default_factory=dict, repr=False)
+    _research: Optional[Dict] = field(default=None, init=False, repr=False)
 
+    @property
+    def research(self) -> Dict:
+        if self._research is None:
+            ctx = self._context
+            self._research = {
+                "trending_hashtags": ctx.get("trending_hashtags", []),
+                "related_topics": ctx.get("related_topics", []),
+                "content_opportunities": ctx.get("content_opportunities", []),
+                "market_intelligence": ctx.get("market_intelligence", ""),
+            }
+        return self._research
 
-# Pipeline definition: (agent_class, weight_for_progress)
+    @property
+    def brand_feedback(self) -> Dict:
+        return self._context.get("brand_feedback", {})
+
+    @property
+    def optimization(self) -> Dict:
+        return self._context.get("optimization", {})
+
+
+# Pipeline definition: (label, agent_class, weight_for_progress, timeout_seconds)
+# A timed-out agent is reported as an error and the workflow moves on
+# without its output, like any other failed agent.
 PIPELINE = [
-    ("InputProcessor",       InputProcessorAgent,       0.10),
-    ("Research",             ResearchAgent,             0.20),
-    ("ContentIntelligence",  ContentIntelligenceAgent,  0.30),
-    ("Generation",           GenerationAgent,           0.55),
-    ("BrandVoice",           BrandVoiceAgent,           0.75),
-    ("Optimization",         OptimizationAgent,         0.95),
+    ("InputProcessor",       InputProcessorAgent,       0.10,  90),
+    ("Research",             ResearchAgent,             0.20,  60),
+    ("ContentIntelligence",  ContentIntelligenceAgent,  0.30,  90),
+    ("Generation",           GenerationAgent,           0.55, 120),
+    ("BrandVoice",           BrandVoiceAgent,           0.75,  90),
+    ("Optimization",         OptimizationAgent,         0.95,  60),
 ]
 
+# Data dependencies: an agent runs once every agent it reads context from
+# has finished. ContentIntelligence reads Research's market intelligence and
+# content gaps, and Optimization scores the brand-adjusted variants, so the
+# current graph is a chain — independent agents added later overlap for free.
+# Work inside an agent that needs only user input (BrandVoice's profile from
+# past_posts) is started alongside the first wave instead.
+PIPELINE_DEPENDENCIES: Dict[str, Set[str]] = {
+    "InputProcessor":      set(),
+    "Research":            {"InputProcessor"},
+    "ContentIntelligence": {"InputProcessor", "Research"},
+    "Generation":          {"ContentIntelligence"},
+    "BrandVoice":          {"Generation"},
+    "Optimization":        {"BrandVoice"},
+}
+
+# How often (seconds) streamed partial output is forwarded to status_callback
+PARTIAL_STATUS_INTERVAL = 0.2
+
+
+@lru_cache(maxsize=8)
+def _shared_agents(llm_provider) -> Dict[str, BaseAgent]:
+    """
+    Agents reused by every orchestrator built on the same provider.
+    lru_cache keys on the provider object and keeps it alive, so a recycled
+    id() can never map to stale agents. Concurrent workflows run on the
+    same instances, so agents must not keep per-run results on themselves.
+    """
+    return {label: agent_cls(llm_provider) for label, agent_cls, _, _ in PIPELINE}
+
 
 class AgentOrchestrator:
     """
@@ -72,6 +130,8 @@ class AgentOrchestrator:
     Args:
         llm_provider: The LLMProvider instance (from core.llm)
         status_callback: Optional callable(WorkflowStatus) for real-time UI updates
+
+    The agents cached for llm_provider are reused instead of rebuilt.
     """
 
     def __init__(
@@ -81,19 +141,11 @@ class AgentOrchestrator:
     ):
         self.llm = llm_provider
         self.status_callback = status_callback
-        self._init_agents()
+        self._partials: Dict[str, str] = {}
+        self._partials_lock = threading.Lock()
+        self.agents = _shared_agents(self.llm)
         logger.info("✅ AgentOrchestrator initialized (6-agent pipeline)")
 
-    def _init_agents(self):
-        self.agents = {
-            "InputProcessor":      InputProcessorAgent(self.llm),
-            "Research":            ResearchAgent(self.llm),
-            "ContentIntelligence": ContentIntelligenceAgent(self.llm),
-            "Generation":          GenerationAgent(self.llm),
-            "BrandVoice":          BrandVoiceAgent(self.llm),
-            "Optimization":        OptimizationAgent(self.llm),
-        }
-
     # ------------------------------------------------------------------
     # PUBLIC
     # ------------------------------------------------------------------
@@ -117,55 +169,59 @@ class AgentOrchestrator:
 
         logger.info("🚀 Orchestrator: starting 6-agent workflow...")
 
-        for label, _, progress in PIPELINE:
-            agent = self.agents[label]
-            self._emit_status(WorkflowStatus(
-                agent_name=label, status="running",
-                message=f"Running {label}...", progress=progress,
-            ))
+        pending = [(label, progress, timeout) for label, _, progress, timeout in PIPELINE]
+        finished: Set[str] = set()
 
-            try:
-                result: AgentResult = agent.run(context)
-                agents_run.append(label)
-
-                if not result.success:
-                    logger.warning(f"⚠️ Agent '{label}' failed: {result.error_message} — continuing")
-                    self._emit_status(WorkflowStatus(
-                        agent_name=label, status="error",
-                        message=result.error_message, progress=progress,
-                    ))
-                    continue
-
-                # Merge result context into shared context dict
-                if result.context_passed:
-                    context.update(result.context_passed)
-                # Also merge the agent's direct output fields
-                if isinstance(result.output, dict):
-                    # Merge output into context, preferring existing values
-                    for k, v in result.output.items():
-                        if k not in context or not context[k]:
-                            context[k] = v
-
-                self._emit_status(WorkflowStatus(
-                    agent_name=label, status="complete",
-                    message=result.summary, progress=progress,
-                    elapsed=result.processing_time,
-                ))
-                logger.info(f"  ✅ {label}: {result.summary}")
-
-            except Exception as exc:
-                logger.error(f"❌ Agent '{label}' raised exception: {exc}")
-                self._emit_status(WorkflowStatus(
-                    agent_name=label, status="error",
-                    message=str(exc), progress=progress,
-                ))
+        # Not a with-block: exiting one would wait on a hung agent's thread
+        pool = ThreadPoolExecutor(max_workers=len(PIPELINE))
+        try:
+            # Brand DNA depends only on past_posts — build it while the chain runs
+            past_posts = context.get("past_posts")
+            if past_posts:
+                pool.submit(self.agents["BrandVoice"].ensure_profile, past_posts)
+
+            while pending:
+                wave = [item for item in pending if PIPELINE_DEPENDENCIES[item[0]] <= finished]
+                if not wave:
+                    logger.error("❌ Unsatisfiable agent dependencies — stopping workflow")
+                    break
+
+                # Agents in one wave share a snapshot so none sees a sibling's partial output
+                snapshot = dict(context)
+                futures = {}
+                for label, progress, timeout in wave:
+                    self._emit_status(
+                        agent_name=label, status="running",
+                        message=f"Running {label}...", progress=progress,
+                    )
+                    deadline = time.time() + timeout
+                    future = pool.submit(self._run_agent, label, snapshot, deadline)
+                    futures[future] = (label, progress, deadline)
+
+                # Merge on this thread as results arrive, so context needs no lock;
+                # wake up periodically to forward streamed partial output
+                not_done = set(futures)
+                while not_done:
+                    done, not_done = wait(
+                        not_done, timeout=PARTIAL_STATUS_INTERVAL, return_when=FIRST_COMPLETED,
+                    )
+                    self._emit_partials({f: futures[f] for f in done | not_done})
+                    for future in done:
+                        label, progress, _ = futures[future]
+                        self._merge_result(label, progress, future, context, agents_run)
+                    not_done -= self._expire(not_done, futures)
+
+                finished.update(label for label, _, _ in wave)
+                pending = [item for item in pending if item[0] not in finished]
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
         total_time = time.time() - workflow_start
-        self._emit_status(WorkflowStatus(
+        self._emit_status(
             agent_name="Orchestrator", status="complete",
             message=f"Workflow complete in {total_time:.1f}s",
             progress=1.0, elapsed=total_time,
-        ))
+        )
 
         # Extract final outputs from merged context
         variants = context.get("variants", {})
@@ -182,26 +238,119 @@ class AgentOrchestrator:
             variants=variants,
             hashtags=context.get("hashtags", ""),
             strategy=context.get("strategy", {}),
-            research={
-                "trending_hashtags": context.get("trending_hashtags", []),
-                "related_topics": context.get("related_topics", []),
-                "content_opportunities": context.get("content_opportunities", []),
-                "market_intelligence": context.get("market_intelligence", ""),
-            },
-            brand_feedback=context.get("brand_feedback", {}),
-            optimization=context.get("optimization", {}),
             overall_recommendations=context.get("overall_recommendations", []),
             best_variant=context.get("best_variant", "storyteller"),
             total_time=round(total_time, 2),
             agents_run=agents_run,
+            _context=context,
         )
 
     # ------------------------------------------------------------------
     # HELPERS
     # ------------------------------------------------------------------
 
-    def _emit_status(self, status: WorkflowStatus):
+    def _run_agent(self, label: str, snapshot: Dict[str, Any], deadline: float) -> AgentResult:
+        """
+        Run one agent on a worker thread, routing its streamed text to this
+        workflow and bounding its LLM calls by the agent's deadline.
+        """
+        token = PARTIAL_OUTPUT.set(
+            partial(self._record_partial, label) if self.status_callback else None
+        )
+        deadline_token = AGENT_DEADLINE.set(deadline)
+        try:
+            return self.agents[label].run(snapshot)
+        finally:
+            AGENT_DEADLINE.reset(deadline_token)
+            PARTIAL_OUTPUT.reset(token)
+
+    def _merge_result(
+        self,
+        label: str,
+        progress: float,
+        future,
+        context: Dict[str, Any],
+        agents_run: List[str],
+    ):
+        """Fold one finished agent's result into the shared context."""
+        try:
+            result: AgentResult = future.result()
+            agents_run.append(label)
+
+            if not result.success:
+                logger.warning(f"⚠️ Agent '{label}' failed: {result.error_message} — continuing")
+                self._emit_status(
+                    agent_name=label, status="error",
+                    message=result.error_message, progress=progress,
+                )
+                return
+
+            # Merge result context into shared context dict
+            if result.context_passed:
+                context.update(result.context_passed)
+            # Also merge the agent's direct output fields
+            if isinstance(result.output, dict):
+                # Merge output into context, preferring existing values
+                for k, v in result.output.items():
+                    if k not in context or not context[k]:
+                        context[k] = v
+            # Downstream agents read a single "tone": the user's choice, else Research's pick
+            if not context.get("tone") and context.get("recommended_tone"):
+                context["tone"] = context["recommended_tone"]
+
+            self._emit_status(
+                agent_name=label, status="complete",
+                message=result.summary, progress=progress,
+                elapsed=result.processing_time,
+            )
+            logger.info(f"  ✅ {label}: {result.summary}")
+
+        except Exception as exc:
+            logger.error(f"❌ Agent '{label}' raised exception: {exc}")
+            self._emit_status(
+                agent_name=label, status="error",
+                message=str(exc), progress=progress,
+            )
+
+    def _expire(self, not_done: Set, futures: Dict) -> Set:
+        """Give up on agents past their deadline; their threads finish unobserved."""
+        now = time.time()
+        expired = set()
+        for future in not_done:
+            label, progress, deadline = futures[future]
+            if now < deadline:
+                continue
+            future.cancel()
+            expired.add(future)
+            logger.error(f"⏱️ Agent '{label}' timed out — continuing without it")
+            self._emit_status(
+                agent_name=label, status="error",
+                message="timeout", progress=progress,
+            )
+        return expired
+
+    def _record_partial(self, label: str, text: str):
+        """Called from agent threads with the text streamed so far."""
+        with self._partials_lock:
+            self._partials[label] = text
+
+    def _emit_partials(self, futures: Dict):
+        with self._partials_lock:
+            partials, self._partials = self._partials, {}
+        if not partials:
+            return
+        for label, progress, _ in futures.values():
+            if label in partials:
+                self._emit_status(
+                    agent_name=label, status="running",
+                    message=f"Running {label}...", progress=progress,
+                    partial_content=partials[label],
+                )
+
+    def _emit_status(self, **fields):
+        """Send a WorkflowStatus to the UI; nothing is built when no one listens."""
         if self.status_callback:
+            status = WorkflowStatus(**fields)
             try:
                 self.status_callback(status)
             except Exception:
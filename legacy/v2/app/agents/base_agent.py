@@ -2,32 +2,65 @@
 Base Agent
 ==========
 Abstract foundation for all agents. Provides:
-  - LLM access via the existing LLMProvider
-  - Short-term memory (conversation history)
+  - LLM access via the existing LLMProvider (deterministic calls are cached
+    in tools.llm_cache)
+  - Short-term memory (bounded conversation history)
   - Tool registration and execution
   - Structured logging / status reporting
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import closing
+from contextvars import ContextVar
+from itertools import islice
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from tools.llm_cache import get_llm_response_cache
 
 
 logger = logging.getLogger(__name__)
 
+# Parent of every per-agent logger ("agent.<name>")
+_AGENT_LOGGER = logging.getLogger("agent")
+
+# Minimum seconds between partial-output callbacks while streaming
+PARTIAL_CALLBACK_INTERVAL = 0.2
+
+# Messages kept per agent; older ones are evicted (or compacted) first
+MEMORY_MAX_MESSAGES = 64
+
+# Receives text-so-far while the LLM streams. Set per run (not per agent) so
+# one agent instance can serve several workflows at once.
+PARTIAL_OUTPUT: ContextVar[Optional[Callable[[str], None]]] = ContextVar(
+    "partial_output", default=None
+)
+
+# Epoch time by which the running agent must finish. LLM calls made during
+# the run get the remaining budget as their request timeout. Set per run,
+# like PARTIAL_OUTPUT.
+AGENT_DEADLINE: ContextVar[Optional[float]] = ContextVar("agent_deadline", default=None)
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentMessage:
     """Single message in an agent's conversation history."""
     role: str       # "user" | "assistant" | "system" | "tool"
     content: str
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: float = field(default_factory=time.time)  # epoch seconds
     metadata: Dict = field(default_factory=dict)
 
+    @property
+    def timestamp_iso(self) -> str:
+        """Timestamp as a local ISO-8601 string, formatted on demand."""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class AgentResult:
     """Standardized output from any agent."""
     success: bool
@@ -52,10 +85,12 @@ class BaseAgent(ABC):
     def __init__(self, name: str, llm_provider=None):
         self.name = name
         self.llm = llm_provider
-        self.memory: List[AgentMessage] = []
+        self.memory: Deque[AgentMessage] = deque(maxlen=MEMORY_MAX_MESSAGES)
         self._tools: Dict[str, Callable] = {}
-        self.logger = logging.getLogger(f"agent.{name}")
-        self.logger.info(f"🤖 Agent '{name}' initialized")
+        self.metadata: Dict = {"llm_cache_hits": 0, "llm_cache_misses": 0}
+        self.logger = _AGENT_LOGGER.getChild(name)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"🤖 Agent '{name}' initialized")
 
     # ------------------------------------------------------------------
     # ABSTRACT
@@ -89,9 +124,23 @@ class BaseAgent(ABC):
 
     def get_context_window(self, last_n: int = 10) -> str:
         """Return last N messages as formatted string."""
-        msgs = self.memory[-last_n:]
+        msgs = islice(self.memory, max(0, len(self.memory) - last_n), None)
         return "\n".join(f"[{m.role.upper()}]: {m.content}" for m in msgs)
 
+    def compact_memory(self, summarizer: Callable[[List[AgentMessage]], str]):
+        """
+        Once memory is full, replace its oldest half with a single system
+        message produced by summarizer(older_messages).
+        """
+        if len(self.memory) < self.memory.maxlen:
+            return
+        older = [self.memory.popleft() for _ in range(self.memory.maxlen // 2)]
+        self.memory.appendleft(AgentMessage(
+            role="system",
+            content=summarizer(older),
+            metadata={"compacted_messages": len(older)},
+        ))
+
     def clear_memory(self):
         self.memory.clear()
 
@@ -99,20 +148,89 @@ class BaseAgent(ABC):
     # LLM WRAPPER
     # ------------------------------------------------------------------
 
-    def think(self, prompt: str, system_prompt: str = "") -> str:
-        """Ask the LLM a question and store the exchange in memory."""
+    def think(self, prompt: str, system_prompt: str = "", max_tokens: Optional[int] = None) -> str:
+        """
+        Ask the LLM a question and store the exchange in memory.
+        max_tokens overrides the provider's completion cap for this call.
+        """
         if not self.llm:
             self.logger.warning("⚠️ No LLM provider — returning empty response")
             return ""
 
         self.remember("user", prompt)
         sys = system_prompt or f"You are {self.name}, a specialized AI agent."
-        result = self.llm.generate(prompt=prompt, system_prompt=sys)
 
-        response = result.content if result.success else ""
+        response = self._cached_generate(prompt, sys, max_tokens) or ""
+
         self.remember("assistant", response)
         return response
 
+    def _cached_generate(
+        self, prompt: str, system_prompt: str, max_tokens: Optional[int] = None
+    ) -> Optional[str]:
+        """_generate_text behind the shared exact-match response cache."""
+        cache = get_llm_response_cache()
+        cache_key = cache.key_for(self.llm, prompt, system_prompt, max_tokens)
+        if cache_key is None:
+            return self._generate_text(prompt, system_prompt, max_tokens)
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            self.metadata["llm_cache_hits"] += 1
+            return cached.content
+
+        self.metadata["llm_cache_misses"] += 1
+        generated = self._generate_text(prompt, system_prompt, max_tokens)
+        if generated is not None:
+            cache.set(cache_key, generated, model=getattr(self.llm.config, "model_name", ""))
+        return generated
+
+    def _generate_text(
+        self, prompt: str, system_prompt: str, max_tokens: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Run one LLM call and return its text, or None on failure.
+        Streams when a PARTIAL_OUTPUT callback is set, so the UI sees text early.
+        """
+        timeout = self._remaining_budget()
+        if timeout is not None and timeout <= 0:
+            self.logger.warning("⏱️ Agent time budget spent — skipping LLM call")
+            return None
+
+        partial_callback = PARTIAL_OUTPUT.get()
+        if not (partial_callback and hasattr(self.llm, "stream_generate")):
+            result = self.llm.generate(
+                prompt=prompt, system_prompt=system_prompt, timeout=timeout, max_tokens=max_tokens
+            )
+            return result.content if result.success else None
+
+        parts: List[str] = []
+        last_emit = time.time()
+        chunks = self.llm.stream_generate(
+            prompt=prompt, system_prompt=system_prompt, timeout=timeout, max_tokens=max_tokens
+        )
+        try:
+            # closing() frees the provider's concurrency slot even if we stop early
+            with closing(chunks):
+                for chunk in chunks:
+                    parts.append(chunk)
+                    if time.time() - last_emit >= PARTIAL_CALLBACK_INTERVAL:
+                        partial_callback("".join(parts))
+                        last_emit = time.time()
+        except Exception as exc:
+            self.logger.warning(f"⚠️ LLM stream failed: {exc}")
+            return None
+
+        text = "".join(parts)
+        partial_callback(text)
+        return text
+
+    @staticmethod
+    def _remaining_budget() -> Optional[float]:
+        """Seconds left before AGENT_DEADLINE, or None when the run is unbounded."""
+        deadline = AGENT_DEADLINE.get()
+        return None if deadline is None else deadline - time.time()
+
     # ------------------------------------------------------------------
     # STATUS HELPERS
     # ------------------------------------------------------------------
@@ -6,12 +6,36 @@ Checks generated variants against the user's brand DNA and
 personalizes them to match the established voice.
 """
 
+import contextvars
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 
 from agents.base_agent import AgentResult, BaseAgent
 from tools.brand_analyzer import BrandAnalyzer, BrandProfile
 
+# Context keys read by run(), fetched in one pass over input_data + defaults
+_BV_DEFAULTS = MappingProxyType({"variants": {}, "hashtags": "", "past_posts": []})
+_get_bv_inputs = itemgetter(*_BV_DEFAULTS)
+
+PERSONALIZE_SYSTEM_PROMPT = "You are a brand voice specialist."
+
+# Only {voice_desc} and {post} vary between calls
+PERSONALIZE_PROMPT_TEMPLATE = (
+    "Rewrite this LinkedIn post to better match this brand voice:\n"
+    "BRAND VOICE: {voice_desc}\n\n"
+    "ORIGINAL POST:\n{post}\n\n"
+    "Rules:\n"
+    "- Keep the core message identical\n"
+    "- Only adjust tone/style to match brand\n"
+    "- No fake statistics\n"
+    "- Return ONLY the rewritten post"
+)
+
 
 class BrandVoiceAgent(BaseAgent):
     """Personalizes posts to match user's brand voice and DNA."""
@@ -21,6 +45,7 @@ class BrandVoiceAgent(BaseAgent):
         self.brand_analyzer = BrandAnalyzer(llm_provider)
         # Try to load persisted brand profile
         self._profile: Optional[BrandProfile] = self.brand_analyzer.load_profile()
+        self._profile_lock = threading.Lock()
 
     def run(self, input_data: Dict) -> AgentResult:
         """
@@ -33,52 +58,45 @@ class BrandVoiceAgent(BaseAgent):
         start = time.time()
         self.logger.info("🎨 BrandVoiceAgent: personalizing for brand voice...")
 
-        variants: Dict = input_data.get("variants", {})
-        hashtags: str = input_data.get("hashtags", "")
-        past_posts: List[str] = input_data.get("past_posts", [])
+        variants, hashtags, past_posts = _get_bv_inputs(ChainMap(input_data, _BV_DEFAULTS))
 
         if not variants:
             return self._failure("No variants to brand-check", time.time() - start)
 
-        # Build brand profile from past posts if provided and no profile loaded
-        if past_posts and (not self._profile or not self._profile.success):
-            self._profile = self.brand_analyzer.analyze_past_posts(past_posts)
-            self.logger.info(f"📊 Brand profile built from {len(past_posts)} past posts")
-
+        # Waits for the orchestrator's prefetch of the same profile, if one is running
+        self.ensure_profile(past_posts)
+
+        # Each variant needs a consistency check and possibly a rewrite —
+        # both LLM round-trips, so run all variants concurrently.
+        checked: Dict[str, Tuple[Dict, str]] = {}
+        with ThreadPoolExecutor(max_workers=len(variants)) as pool:
+            futures = [
+                # copy_context keeps streamed rewrites flowing to the workflow's UI
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self._brand_check_variant, variant_key, post_text,
+                )
+                for variant_key, post_text in variants.items()
+            ]
+            for future in as_completed(futures):
+                variant_key, feedback, adjusted = future.result()
+                checked[variant_key] = (feedback, adjusted)
+
+        # Re-assemble in the original variant order
         brand_feedback: Dict = {}
-        adjusted_variants: Dict = dict(variants)
-
-        for variant_key, post_text in variants.items():
-            if self._profile and self._profile.success:
-                check = self.brand_analyzer.check_consistency(post_text, self._profile)
-                brand_feedback[variant_key] = {
-                    "consistency_score": check.consistency_score,
-                    "aligned": check.aligned_elements,
-                    "deviations": check.deviations,
-                    "suggestions": check.suggestions,
-                    "brand_aligned": check.brand_aligned,
-                }
-
-                # If LLM available and consistency is low, personalize
-                if self.llm and check.consistency_score < 0.7 and self._profile:
-                    adjusted = self._personalize(post_text, self._profile)
-                    if adjusted:
-                        adjusted_variants[variant_key] = adjusted
-            else:
-                brand_feedback[variant_key] = {
-                    "consistency_score": 0.7,
-                    "aligned": ["No brand profile available — post is ready to use"],
-                    "deviations": [],
-                    "suggestions": ["Add past posts to build your brand DNA for better personalization"],
-                    "brand_aligned": True,
-                }
+        overrides: Dict[str, str] = {}
+        for variant_key in variants:
+            feedback, adjusted = checked[variant_key]
+            brand_feedback[variant_key] = feedback
+            if adjusted:
+                overrides[variant_key] = adjusted
 
         avg_score = sum(
             v.get("consistency_score", 0.7) for v in brand_feedback.values()
         ) / max(1, len(brand_feedback))
 
         output = {
-            "variants": adjusted_variants,
+            "variants": {**variants, **overrides} if overrides else variants,
             "hashtags": hashtags,
             "brand_feedback": brand_feedback,
             "brand_consistency_avg": round(avg_score, 2),
@@ -93,27 +111,55 @@ class BrandVoiceAgent(BaseAgent):
             time=time.time() - start,
         )
 
+    def ensure_profile(self, past_posts: List[str]) -> Optional[BrandProfile]:
+        """
+        Build the brand profile from past posts unless one is already loaded.
+        Needs nothing from earlier agents, so the orchestrator starts it early.
+        """
+        with self._profile_lock:
+            if past_posts and (not self._profile or not self._profile.success):
+                self._profile = self.brand_analyzer.analyze_past_posts(past_posts)
+                self.logger.info(f"📊 Brand profile built from {len(past_posts)} past posts")
+            return self._profile
+
+    # ------------------------------------------------------------------
+    # PER-VARIANT CHECK
+    # ------------------------------------------------------------------
+
+    def _brand_check_variant(self, variant_key: str, post_text: str) -> Tuple[str, Dict, str]:
+        """Check one variant against brand DNA; return (key, feedback, rewritten post or "")."""
+        if not (self._profile and self._profile.success):
+            return variant_key, {
+                "consistency_score": 0.7,
+                "aligned": ["No brand profile available — post is ready to use"],
+                "deviations": [],
+                "suggestions": ["Add past posts to build your brand DNA for better personalization"],
+                "brand_aligned": True,
+            }, ""
+
+        check = self.brand_analyzer.check_consistency(post_text, self._profile)
+        feedback = {
+            "consistency_score": check.consistency_score,
+            "aligned": check.aligned_elements,
+            "deviations": check.deviations,
+            "suggestions": check.suggestions,
+            "brand_aligned": check.brand_aligned,
+        }
+
+        # If LLM available and consistency is low, personalize
+        adjusted = ""
+        if self.llm and check.consistency_score < 0.7:
+            adjusted = self._personalize(post_text, self._profile)
+        return variant_key, feedback, adjusted
+
     # ------------------------------------------------------------------
     # PERSONALIZATION
     # ------------------------------------------------------------------
 
     def _personalize(self, post: str, profile: BrandProfile) -> str:
         """Ask LLM to rewrite post to better match brand DNA."""
-        voice_desc = profile.brand_voice_summary or (
-            f"Tone: {profile.dominant_tone}. "
-            f"Uses emojis: {profile.uses_emojis}. "
-            f"Storytelling: {profile.uses_storytelling}. "
-            f"Lists: {profile.uses_lists}."
-        )
-        prompt = (
-            f"Rewrite this LinkedIn post to better match this brand voice:\n"
-            f"BRAND VOICE: {voice_desc}\n\n"
-            f"ORIGINAL POST:\n{post}\n\n"
-            f"Rules:\n"
-            f"- Keep the core message identical\n"
-            f"- Only adjust tone/style to match brand\n"
-            f"- No fake statistics\n"
-            f"- Return ONLY the rewritten post"
+        prompt = PERSONALIZE_PROMPT_TEMPLATE.format(
+            voice_desc=profile.brand_voice_summary, post=post
         )
-        result = self.llm.generate(prompt=prompt, system_prompt="You are a brand voice specialist.")
-        return result.content.strip() if result.success else ""
+        rewritten = self._generate_text(prompt, PERSONALIZE_SYSTEM_PROMPT)
+        return rewritten.strip() if rewritten else ""
@@ -3,15 +3,86 @@ Content Intelligence Agent
 ==========================
 Third agent in the pipeline.
 Develops a full content strategy: identifies key messages, segments the
-audience, and plans 3 post angles to be generated next.
+audience, and plans 3 post angles. The same LLM call also drafts all three
+posts, so GenerationAgent only has to validate them.
 """
 
+import json
+import re
 import time
+from collections import ChainMap
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, List
 
 from agents.base_agent import AgentResult, BaseAgent
 
 
+# Static part of the strategy prompt. It is sent first and byte-identical on
+# every run so the provider can reuse its cached prefix; per-run fields follow.
+STRATEGY_SYSTEM_PROMPT = "You are a senior LinkedIn content strategist."
+
+STRATEGY_INSTRUCTIONS = (
+    "Build a LinkedIn content strategy for the topic described at the end.\n\n"
+    "Return:\n"
+    "KEY_MESSAGE: [the single most important thing to communicate]\n"
+    "TARGET_AUDIENCE: [specific audience description]\n"
+    "EMOTIONAL_HOOK: [the emotional angle to lead with]\n"
+    "ANGLE_1_STORYTELLER: [narrative-driven post angle in 2 sentences]\n"
+    "ANGLE_2_STRATEGIST: [data/insight-driven angle in 2 sentences]\n"
+    "ANGLE_3_PROVOCATEUR: [contrarian/bold angle in 2 sentences]\n"
+    "CONTENT_PILLARS: [3 content pillars, comma-separated]\n"
+    "CALL_TO_ACTION: [best CTA for this content]\n\n"
+    "Then write one finished LinkedIn post per angle and return them as a "
+    "```json fenced block holding exactly this object:\n"
+    '{"storyteller": "...", "strategist": "...", "provocateur": "..."}\n'
+    "Post rules: max 1500 characters, no fake statistics unless from the "
+    "content, line breaks for mobile readability, end with a genuine "
+    "question, no hashtags.\n\n"
+)
+
+# The strategy lines plus three ~1500-character drafts (~400 tokens each,
+# more once JSON-escaped) overrun the provider's default 1000-token cap;
+# a truncated reply loses the whole drafts block
+STRATEGY_MAX_TOKENS = 2048
+
+# Context keys read by run(), fetched in one pass over input_data + defaults
+_CI_DEFAULTS = MappingProxyType({
+    "synthesis": "",
+    "combined_content": "",
+    "hashtags": "",
+    "market_intelligence": "",
+    "content_gaps": "",
+    "tone": "",
+    "recommended_tone": "professional",
+    "audience": "professionals",
+    "best_content_type": "educational",
+})
+_get_ci_inputs = itemgetter(*_CI_DEFAULTS)
+
+# ```json { ... } ``` block carrying the drafted posts
+_DRAFTS_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+
+# One "KEY: value" line of the strategy response
+_STRATEGY_LINE_RE = re.compile(
+    r"^[ \t]*(KEY_MESSAGE|TARGET_AUDIENCE|EMOTIONAL_HOOK|ANGLE_1_STORYTELLER|"
+    r"ANGLE_2_STRATEGIST|ANGLE_3_PROVOCATEUR|CONTENT_PILLARS|CALL_TO_ACTION)"
+    r"[ \t]*:[ \t]*(.*?)[ \t]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+_STRATEGY_KEY_MAP = {
+    "KEY_MESSAGE": "key_message",
+    "TARGET_AUDIENCE": "target_audience",
+    "EMOTIONAL_HOOK": "emotional_hook",
+    "ANGLE_1_STORYTELLER": "angle_storyteller",
+    "ANGLE_2_STRATEGIST": "angle_strategist",
+    "ANGLE_3_PROVOCATEUR": "angle_provocateur",
+    "CONTENT_PILLARS": "content_pillars",
+    "CALL_TO_ACTION": "call_to_action",
+}
+
+
 class ContentIntelligenceAgent(BaseAgent):
     """Builds the content strategy and post variant plan."""
 
@@ -34,42 +105,35 @@ class ContentIntelligenceAgent(BaseAgent):
         start = time.time()
         self.logger.info("🧠 ContentIntelligenceAgent: building strategy...")
 
-        synthesis = input_data.get("synthesis", "")
-        combined = input_data.get("combined_content", "")
-        hashtags = input_data.get("hashtags", "")
-        market_intel = input_data.get("market_intelligence", "")
-        content_gaps = input_data.get("content_gaps", "")
-        tone = input_data.get("tone") or input_data.get("recommended_tone", "professional")
-        audience = input_data.get("audience", "professionals")
-        content_type = input_data.get("best_content_type", "educational")
+        (
+            synthesis, combined, hashtags, market_intel, content_gaps,
+            tone, recommended_tone, audience, content_type,
+        ) = _get_ci_inputs(ChainMap(input_data, _CI_DEFAULTS))
+        # The orchestrator already folds recommended_tone into tone; this
+        # covers direct callers
+        tone = tone or recommended_tone
 
         if not synthesis and not combined:
             return self._failure("No content to strategize", time.time() - start)
 
         strategy = {}
+        drafts: Dict[str, str] = {}
         angles = self._default_angles()
 
         if self.llm:
             strategy_raw = self.think(
                 prompt=(
-                    f"Build a LinkedIn content strategy for this topic.\n\n"
-                    f"CONTENT:\n{synthesis[:2000]}\n\n"
+                    STRATEGY_INSTRUCTIONS
+                    + f"CONTENT:\n{synthesis[:2000]}\n\n"
                     f"MARKET INTELLIGENCE:\n{market_intel}\n\n"
                     f"CONTENT GAPS:\n{content_gaps}\n\n"
-                    f"Tone preference: {tone} | Audience: {audience}\n\n"
-                    f"Return:\n"
-                    f"KEY_MESSAGE: [the single most important thing to communicate]\n"
-                    f"TARGET_AUDIENCE: [specific audience description]\n"
-                    f"EMOTIONAL_HOOK: [the emotional angle to lead with]\n"
-                    f"ANGLE_1_STORYTELLER: [narrative-driven post angle in 2 sentences]\n"
-                    f"ANGLE_2_STRATEGIST: [data/insight-driven angle in 2 sentences]\n"
-                    f"ANGLE_3_PROVOCATEUR: [contrarian/bold angle in 2 sentences]\n"
-                    f"CONTENT_PILLARS: [3 content pillars, comma-separated]\n"
-                    f"CALL_TO_ACTION: [best CTA for this content]"
+                    f"Tone preference: {tone} | Audience: {audience}"
                 ),
-                system_prompt="You are a senior LinkedIn content strategist.",
+                system_prompt=STRATEGY_SYSTEM_PROMPT,
+                max_tokens=STRATEGY_MAX_TOKENS,
             )
-            strategy = self._parse_strategy(strategy_raw)
+            drafts = self._parse_drafts(strategy_raw)
+            strategy = self._parse_strategy(_DRAFTS_BLOCK_RE.sub("", strategy_raw))
             angles = {
                 "storyteller": strategy.pop("angle_storyteller", angles["storyteller"]),
                 "strategist": strategy.pop("angle_strategist", angles["strategist"]),
@@ -87,6 +151,7 @@ class ContentIntelligenceAgent(BaseAgent):
         output = {
             "strategy": strategy,
             "angles": angles,
+            "drafts": drafts,
             "tone": tone,
             "audience": audience,
             "content_type": content_type,
@@ -97,7 +162,7 @@ class ContentIntelligenceAgent(BaseAgent):
 
         return self._success(
             output=output,
-            summary=f"Strategy built: 3 angles identified | KM: {strategy.get('key_message', '')[:80]}",
+            summary=f"Strategy built: 3 angles, {len(drafts)} drafts | KM: {strategy.get('key_message', '')[:80]}",
             context=output,
             next_hint="GenerationAgent",
             time=time.time() - start,
@@ -109,29 +174,31 @@ class ContentIntelligenceAgent(BaseAgent):
 
     def _parse_strategy(self, raw: str) -> Dict:
         data: Dict = {}
-        for line in raw.strip().split("\n"):
-            if ":" in line:
-                k, _, v = line.partition(":")
-                key = k.strip().upper()
-                val = v.strip()
-                if key == "KEY_MESSAGE":
-                    data["key_message"] = val
-                elif key == "TARGET_AUDIENCE":
-                    data["target_audience"] = val
-                elif key == "EMOTIONAL_HOOK":
-                    data["emotional_hook"] = val
-                elif key == "ANGLE_1_STORYTELLER":
-                    data["angle_storyteller"] = val
-                elif key == "ANGLE_2_STRATEGIST":
-                    data["angle_strategist"] = val
-                elif key == "ANGLE_3_PROVOCATEUR":
-                    data["angle_provocateur"] = val
-                elif key == "CONTENT_PILLARS":
-                    data["content_pillars"] = [p.strip() for p in val.split(",")]
-                elif key == "CALL_TO_ACTION":
-                    data["call_to_action"] = val
+        for key, val in _STRATEGY_LINE_RE.findall(raw):
+            key = key.upper()
+            if key == "CONTENT_PILLARS":
+                data["content_pillars"] = [p.strip() for p in val.split(",")]
+            else:
+                data[_STRATEGY_KEY_MAP[key]] = val
         return data
 
+    def _parse_drafts(self, raw: str) -> Dict[str, str]:
+        """Pull the drafted posts out of the fenced JSON block, if present and valid."""
+        match = _DRAFTS_BLOCK_RE.search(raw)
+        if not match:
+            return {}
+        try:
+            parsed = json.loads(match.group(1))
+        except ValueError:
+            self.logger.warning("⚠️ Strategy drafts block is not valid JSON — ignoring")
+            return {}
+        if not isinstance(parsed, dict):
+            return {}
+        return {
+            key: val for key, val in parsed.items()
+            if key in self._default_angles() and isinstance(val, str) and val.strip()
+        }
+
     def _default_angles(self) -> Dict:
         return {
             "storyteller": "Share a personal narrative around the topic.",
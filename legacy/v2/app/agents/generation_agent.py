@@ -4,12 +4,21 @@ Generation Agent
 Fourth agent in the pipeline.
 Generates 3 optimized LinkedIn post variants using the strategy from
 ContentIntelligenceAgent: Storyteller, Strategist, Provocateur.
+
+ContentIntelligenceAgent drafts all three posts in its strategy call; drafts
+that pass validation are used as-is and only missing or unusable variants
+get their own LLM call. Those calls stream: each variant's text is
+forwarded to the UI one completed sentence at a time.
 """
 
+import contextvars
+import re
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 
-from agents.base_agent import AgentResult, BaseAgent
+from agents.base_agent import PARTIAL_OUTPUT, AgentResult, BaseAgent
 
 
 VARIANT_SYSTEM_PROMPTS = {
@@ -30,6 +39,73 @@ VARIANT_SYSTEM_PROMPTS = {
     ),
 }
 
+# Static instructions shared by every variant call. They live in the system
+# message so the per-call user prompt carries only the dynamic fields and
+# the stable prefix can be reused by provider-side prompt caching.
+VARIANT_RULES = (
+    "RULES:\n"
+    "- Max 1500 characters (ideal LinkedIn length)\n"
+    "- No fake statistics unless from the source content\n"
+    "- End with a genuine question\n"
+    "- Use line breaks for mobile readability\n"
+    "- DO NOT include hashtags (handled separately)\n"
+    "- Return ONLY the post text, no labels or explanations"
+)
+
+_VARIANT_SYSTEM_MESSAGES = {
+    variant: f"{persona}\n\n{VARIANT_RULES}"
+    for variant, persona in VARIANT_SYSTEM_PROMPTS.items()
+}
+
+# Per-call user prompt: only these fields change between calls
+_VARIANT_USER_TEMPLATE = (
+    "Write a LinkedIn post using the '{variant}' style.\n\n"
+    "CONTENT TO USE:\n{content}\n\n"
+    "POST ANGLE: {angle}\n"
+    "KEY MESSAGE: {key_message}\n"
+    "TONE: {tone}\n"
+    "TARGET AUDIENCE: {audience}\n"
+    "CALL TO ACTION: {cta}"
+)
+
+# Offline templates used when no LLM is available or a call fails
+FALLBACK_TEMPLATES = {
+    "storyteller": (
+        "Here's what changed my perspective on {topic}...\n\n"
+        "Three years ago I wouldn't have believed it.\n"
+        "Now it's how I approach everything.\n\n"
+        "The journey matters more than the destination.\n\n"
+        "What has shifted your perspective recently?"
+    ),
+    "strategist": (
+        "Most people overlook this about {topic}.\n\n"
+        "Here's a framework that actually works:\n\n"
+        "• Start with the outcome\n"
+        "• Remove friction at every step\n"
+        "• Measure what matters\n\n"
+        "Which step matters most to you?"
+    ),
+    "provocateur": (
+        "Unpopular opinion: {topic} is misunderstood.\n\n"
+        "Everyone talks about the 'right way'.\n"
+        "No one talks about the cost.\n\n"
+        "Maybe it's time to challenge the default.\n\n"
+        "Do you agree — or am I wrong?"
+    ),
+}
+
+# Bounds for accepting a draft written by ContentIntelligenceAgent
+DRAFT_MIN_CHARS = 100
+DRAFT_MAX_CHARS = 3000
+
+_HASHTAG_LINE_RE = re.compile(r"^\s*(#\w+\s*)+$")
+
+# Any whitespace run (newlines included), collapsed to one space in topics
+_WS_RE = re.compile(r"\s+")
+
+# End of a sentence: terminal punctuation followed by whitespace or end of text
+_SENTENCE_END_RE = re.compile(r"[.!?…](?=\s|$)")
+
 
 class GenerationAgent(BaseAgent):
     """Creates 3 LinkedIn post variants from the content strategy."""
@@ -41,6 +117,7 @@ class GenerationAgent(BaseAgent):
         """
         input_data (merged context, includes ContentIntelligenceAgent output):
             strategy        : dict
+            drafts          : dict (optional, pre-written variants)
             angles          : dict (storyteller/strategist/provocateur)
             synthesis       : str
             combined_content: str
@@ -53,6 +130,7 @@ class GenerationAgent(BaseAgent):
 
         strategy: Dict = input_data.get("strategy", {})
         angles: Dict = input_data.get("angles", {})
+        drafts: Dict = input_data.get("drafts") or {}
         synthesis = input_data.get("synthesis", "")
         combined = input_data.get("combined_content", synthesis)
         tone = input_data.get("tone", "professional")
@@ -65,18 +143,42 @@ class GenerationAgent(BaseAgent):
         variants: Dict[str, str] = {}
         variant_names = ["storyteller", "strategist", "provocateur"]
 
+        missing: List[str] = []
         for variant in variant_names:
-            post = self._generate_variant(
-                variant_type=variant,
-                angle=angles.get(variant, ""),
-                content=combined[:2500],
-                strategy=strategy,
-                tone=tone,
-                audience=audience,
-                hashtags=hashtags,
-            )
-            variants[variant] = post
-            self.logger.info(f"  ✅ {variant.capitalize()} variant generated ({len(post)} chars)")
+            post = self._clean_draft(drafts.get(variant, ""))
+            if post:
+                variants[variant] = post
+                self.logger.info(f"  ✅ {variant.capitalize()} variant taken from strategy draft ({len(post)} chars)")
+            else:
+                missing.append(variant)
+
+        # Each remaining variant is an independent LLM round-trip — run them concurrently
+        if missing:
+            partial_sink = PARTIAL_OUTPUT.get()
+            content = combined[:2500]  # one copy shared by every variant call
+            with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+                futures = {
+                    # copy_context keeps the agent's deadline on the worker threads
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        self._stream_variant,
+                        partial_sink,
+                        variant_type=variant,
+                        angle=angles.get(variant, ""),
+                        content=content,
+                        strategy=strategy,
+                        tone=tone,
+                        audience=audience,
+                        hashtags=hashtags,
+                    ): variant
+                    for variant in missing
+                }
+                for future in as_completed(futures):
+                    variants[futures[future]] = future.result()
+            for variant in missing:
+                self.logger.info(f"  ✅ {variant.capitalize()} variant generated ({len(variants[variant])} chars)")
+        # Keep the storyteller/strategist/provocateur order regardless of completion order
+        variants = {variant: variants[variant] for variant in variant_names}
 
         output = {
             "variants": variants,
@@ -94,12 +196,49 @@ class GenerationAgent(BaseAgent):
             context=output,
             next_hint="BrandVoiceAgent",
             time=time.time() - start,
+            # How many variants came from the batched strategy call vs. their own call
+            metadata={"drafts_used": len(variant_names) - len(missing), "variant_calls": len(missing)},
         )
 
     # ------------------------------------------------------------------
     # GENERATION
     # ------------------------------------------------------------------
 
+    def _clean_draft(self, draft: str) -> str:
+        """Normalise a pre-written draft; returns "" if it is unusable."""
+        if not isinstance(draft, str):
+            return ""
+        lines = draft.strip().splitlines()
+        while lines and (not lines[-1].strip() or _HASHTAG_LINE_RE.match(lines[-1])):
+            lines.pop()
+        post = "\n".join(lines).strip()
+        if not DRAFT_MIN_CHARS <= len(post) <= DRAFT_MAX_CHARS:
+            return ""
+        return post
+
+    def _stream_variant(self, partial_sink: Optional[Callable[[str], None]], **kwargs) -> str:
+        """
+        _generate_variant on a worker thread, forwarding the streamed text to
+        partial_sink up to its last completed sentence, tagged with the variant.
+        """
+        if partial_sink is None:
+            return self._generate_variant(**kwargs)
+
+        variant_type = kwargs["variant_type"]
+
+        def on_partial(text: str):
+            last_end = None
+            for last_end in _SENTENCE_END_RE.finditer(text):
+                pass
+            if last_end is not None:
+                partial_sink(f"[{variant_type}] {text[:last_end.end()]}")
+
+        token = PARTIAL_OUTPUT.set(on_partial)
+        try:
+            return self._generate_variant(**kwargs)
+        finally:
+            PARTIAL_OUTPUT.reset(token)
+
     def _generate_variant(
         self,
         variant_type: str,
@@ -113,54 +252,25 @@ class GenerationAgent(BaseAgent):
         if not self.llm:
             return self._fallback_variant(variant_type, content)
 
-        sys_prompt = VARIANT_SYSTEM_PROMPTS.get(variant_type, VARIANT_SYSTEM_PROMPTS["storyteller"])
-        key_message = strategy.get("key_message", "")
-        cta = strategy.get("call_to_action", "What do you think? Share in the comments.")
-
-        prompt = (
-            f"Write a LinkedIn post using the '{variant_type}' style.\n\n"
-            f"CONTENT TO USE:\n{content}\n\n"
-            f"POST ANGLE: {angle}\n"
-            f"KEY MESSAGE: {key_message}\n"
-            f"TONE: {tone}\n"
-            f"TARGET AUDIENCE: {audience}\n"
-            f"CALL TO ACTION: {cta}\n\n"
-            f"RULES:\n"
-            f"- Max 1500 characters (ideal LinkedIn length)\n"
-            f"- No fake statistics unless from the source content\n"
-            f"- End with a genuine question\n"
-            f"- Use line breaks for mobile readability\n"
-            f"- DO NOT include hashtags (handled separately)\n"
-            f"- Return ONLY the post text, no labels or explanations"
+        sys_prompt = _VARIANT_SYSTEM_MESSAGES.get(variant_type, _VARIANT_SYSTEM_MESSAGES["storyteller"])
+        prompt = _VARIANT_USER_TEMPLATE.format(
+            variant=variant_type,
+            content=content,
+            angle=angle,
+            key_message=strategy.get("key_message", ""),
+            tone=tone,
+            audience=audience,
+            cta=strategy.get("call_to_action", "What do you think? Share in the comments."),
         )
 
-        result = self.llm.generate(prompt=prompt, system_prompt=sys_prompt)
-        return result.content.strip() if result.success else self._fallback_variant(variant_type, content)
+        post = self._cached_generate(prompt, sys_prompt)
+        return post.strip() if post is not None else self._fallback_variant(variant_type, content)
 
     def _fallback_variant(self, variant_type: str, content: str) -> str:
-        topic = content[:80].replace("\n", " ")
-        fallbacks = {
-            "storyteller": (
-                f"Here's what changed my perspective on {topic}...\n\n"
-                f"Three years ago I wouldn't have believed it.\n"
-                f"Now it's how I approach everything.\n\n"
-                f"The journey matters more than the destination.\n\n"
-                f"What has shifted your perspective recently?"
-            ),
-            "strategist": (
-                f"Most people overlook this about {topic}.\n\n"
-                f"Here's a framework that actually works:\n\n"
-                f"• Start with the outcome\n"
-                f"• Remove friction at every step\n"
-                f"• Measure what matters\n\n"
-                f"Which step matters most to you?"
-            ),
-            "provocateur": (
-                f"Unpopular opinion: {topic} is misunderstood.\n\n"
-                f"Everyone talks about the 'right way'.\n"
-                f"No one talks about the cost.\n\n"
-                f"Maybe it's time to challenge the default.\n\n"
-                f"Do you agree — or am I wrong?"
-            ),
-        }
-        return fallbacks.get(variant_type, fallbacks["storyteller"])
+        return _make_fallback(variant_type, _WS_RE.sub(" ", content[:80]))
+
+
+@lru_cache(maxsize=128)
+def _make_fallback(variant_type: str, topic: str) -> str:
+    template = FALLBACK_TEMPLATES.get(variant_type, FALLBACK_TEMPLATES["storyteller"])
+    return template.format(topic=topic)
@@ -6,24 +6,51 @@ Processes multi-modal input (text, images, documents, URLs) and
 extracts structured meaning to hand off to the Research Agent.
 """
 
+import io
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from agents.base_agent import AgentResult, BaseAgent
 from tools.document_processor import DocumentProcessor
 from tools.vision_analyzer import VisionAnalyzer
 from tools.web_scraper import WebScraper
 
+# Upper bound on concurrent image/document/URL extractions
+MAX_EXTRACTION_WORKERS = 16
+
+# Combined content this short is already its own synthesis — skip the LLM
+SYNTHESIS_MIN_CHARS = 400
+
 
 class InputProcessorAgent(BaseAgent):
     """Processes all input modalities and extracts core themes/content."""
 
     def __init__(self, llm_provider=None):
         super().__init__("InputProcessor", llm_provider)
-        self.vision = VisionAnalyzer(llm_provider)
-        self.doc_processor = DocumentProcessor(llm_provider)
-        self.web_scraper = WebScraper(llm_provider)
+        # Built on first use, so text-only runs never construct them
+        self._vision: Optional[VisionAnalyzer] = None
+        self._doc_processor: Optional[DocumentProcessor] = None
+        self._web_scraper: Optional[WebScraper] = None
+
+    @property
+    def vision(self) -> VisionAnalyzer:
+        if self._vision is None:
+            self._vision = VisionAnalyzer(self.llm)
+        return self._vision
+
+    @property
+    def doc_processor(self) -> DocumentProcessor:
+        if self._doc_processor is None:
+            self._doc_processor = DocumentProcessor(self.llm)
+        return self._doc_processor
+
+    @property
+    def web_scraper(self) -> WebScraper:
+        if self._web_scraper is None:
+            self._web_scraper = WebScraper(self.llm)
+        return self._web_scraper
 
     # ------------------------------------------------------------------
     # MAIN ENTRY
@@ -50,55 +77,51 @@ class InputProcessorAgent(BaseAgent):
         if not any([text, image_paths, doc_paths, urls]):
             return self._failure("No input provided", time.time() - start)
 
-        extracted_pieces: List[str] = []
+        # Pieces are streamed into one buffer ("\n\n"-separated) as they are assembled
+        buf = io.StringIO()
+        piece_count = 0
         content_types: List[str] = []
-        themes: List[str] = []
+        themes: Dict[str, None] = {}  # ordered set: images often repeat themes
 
         # 1. Direct text
         if text:
-            extracted_pieces.append(f"[TEXT INPUT]\n{text}")
+            buf.write(f"[TEXT INPUT]\n{text}")
+            piece_count += 1
             content_types.append("text")
 
-        # 2. Images
-        for path in image_paths:
-            result = self.vision.analyze_image(path)
-            if result.success:
-                extracted_pieces.append(
-                    f"[IMAGE: {path}]\n"
-                    f"Description: {result.description}\n"
-                    f"Themes: {', '.join(result.key_themes)}\n"
-                    f"Content angles: {', '.join(result.content_angles)}"
-                )
-                themes.extend(result.key_themes)
-                content_types.append("image")
-
-        # 3. Documents
-        for path in doc_paths:
-            result = self.doc_processor.process(path)
-            if result.success:
-                extracted_pieces.append(
-                    f"[DOCUMENT: {path}]\n"
-                    f"Summary: {result.summary}\n"
-                    f"Key points:\n" + "\n".join(f"  - {p}" for p in result.key_points)
-                )
-                content_types.append("document")
-
-        # 4. URLs
-        for url in urls:
-            result = self.web_scraper.scrape(url)
-            if result.success:
-                extracted_pieces.append(
-                    f"[URL: {url}]\n"
-                    f"Title: {result.title}\n"
-                    f"Description: {result.description}\n"
-                    f"Key points:\n" + "\n".join(f"  - {p}" for p in result.key_points)
-                )
-                content_types.append("url")
-
-        combined = "\n\n".join(extracted_pieces)
+        # 2-4. Images, documents and URLs are independent I/O — extract them
+        # concurrently, then assemble in submission order so output is stable
+        sources: List[Tuple[str, str]] = (
+            [("image", path) for path in image_paths]
+            + [("document", path) for path in doc_paths]
+            + [("url", url) for url in urls]
+        )
+        if sources:
+            extracted: List[Optional[Tuple[str, List[str]]]] = [None] * len(sources)
+            with ThreadPoolExecutor(max_workers=min(MAX_EXTRACTION_WORKERS, len(sources))) as pool:
+                futures = {
+                    pool.submit(self._extract_source, kind, source): idx
+                    for idx, (kind, source) in enumerate(sources)
+                }
+                for future in as_completed(futures):
+                    extracted[futures[future]] = future.result()
+
+            for idx, (kind, _) in enumerate(sources):
+                item, extracted[idx] = extracted[idx], None  # release as we write
+                if item is None:
+                    continue
+                piece, piece_themes = item
+                if piece_count:
+                    buf.write("\n\n")
+                buf.write(piece)
+                piece_count += 1
+                themes.update(dict.fromkeys(piece_themes))
+                content_types.append(kind)
+
+        combined = buf.getvalue()
 
         # Use LLM to synthesize themes if available
-        if self.llm and combined:
+        if self.llm and len(combined) > SYNTHESIS_MIN_CHARS:
             synthesis = self.think(
                 prompt=(
                     f"From the following multi-modal content, extract:\n"
@@ -110,6 +133,8 @@ class InputProcessorAgent(BaseAgent):
                 ),
                 system_prompt="You are an expert content strategist.",
             )
+        elif len(combined) <= SYNTHESIS_MIN_CHARS:
+            synthesis = combined
         else:
             synthesis = combined[:500]
 
@@ -121,13 +146,53 @@ class InputProcessorAgent(BaseAgent):
             "image_count": len(image_paths),
             "doc_count": len(doc_paths),
             "url_count": len(urls),
-            "themes": themes,
+            "themes": list(themes),
         }
 
         return self._success(
             output=output,
-            summary=f"Processed {len(extracted_pieces)} input sources ({', '.join(set(content_types))})",
+            summary=f"Processed {piece_count} input sources ({', '.join(set(content_types))})",
             context={"extracted_content": combined[:2000], "synthesis": synthesis},
             next_hint="ResearchAgent",
             time=time.time() - start,
         )
+
+    # ------------------------------------------------------------------
+    # EXTRACTION
+    # ------------------------------------------------------------------
+
+    def _extract_source(self, kind: str, source: str) -> Optional[Tuple[str, List[str]]]:
+        """Extract one image/document/URL; returns (piece, themes) or None on failure."""
+        if kind == "image":
+            result = self.vision.analyze_image(source)
+            if not result.success:
+                return None
+            return (
+                f"[IMAGE: {source}]\n"
+                f"Description: {result.description}\n"
+                f"Themes: {', '.join(result.key_themes)}\n"
+                f"Content angles: {', '.join(result.content_angles)}",
+                result.key_themes,
+            )
+
+        if kind == "document":
+            result = self.doc_processor.process(source)
+            if not result.success:
+                return None
+            return (
+                f"[DOCUMENT: {source}]\n"
+                f"Summary: {result.summary}\n"
+                f"Key points:\n" + "\n".join(f"  - {p}" for p in result.key_points),
+                [],
+            )
+
+        result = self.web_scraper.scrape(source)
+        if not result.success:
+            return None
+        return (
+            f"[URL: {source}]\n"
+            f"Title: {result.title}\n"
+            f"Description: {result.description}\n"
+            f"Key points:\n" + "\n".join(f"  - {p}" for p in result.key_points),
+            [],
+        )
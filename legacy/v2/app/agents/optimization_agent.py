@@ -7,12 +7,16 @@ and produces the final polished outputs.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
 from agents.base_agent import AgentResult, BaseAgent
 from tools.engagement_predictor import EngagementPredictor
 from tools.sentiment_analyzer import SentimentAnalyzer
 
+# Deletes spaces when turning a content pillar into a hashtag
+_STRIP_SPACE = str.maketrans("", "", " ")
+
 
 class OptimizationAgent(BaseAgent):
     """Optimizes posts for reach, engagement, and timing."""
@@ -45,11 +49,20 @@ class OptimizationAgent(BaseAgent):
         best_variant_key = "storyteller"
         best_score = 0.0
 
-        for variant_key, post_text in variants.items():
-            # Engagement prediction
-            eng = self.engagement_predictor.predict(post_text, hashtags)
-            # Sentiment analysis
-            sent = self.sentiment_analyzer.analyze(post_text)
+        # Engagement prediction + sentiment analysis for every variant are
+        # independent model calls — submit all of them at once
+        with ThreadPoolExecutor(max_workers=2 * len(variants)) as pool:
+            pending = {
+                variant_key: (
+                    pool.submit(self.engagement_predictor.predict, post_text, hashtags),
+                    pool.submit(self.sentiment_analyzer.analyze, post_text),
+                )
+                for variant_key, post_text in variants.items()
+            }
+
+        for variant_key, (eng_future, sent_future) in pending.items():
+            eng = eng_future.result()
+            sent = sent_future.result()
 
             opt_tips = eng.optimization_tips if eng.success else []
             if sent.success:
@@ -73,7 +86,7 @@ class OptimizationAgent(BaseAgent):
                     "sentiment": sent.overall_sentiment if sent.success else "neutral",
                     "audience_perception": sent.audience_perception if sent.success else "",
                 },
-                "optimization_tips": list(dict.fromkeys(opt_tips))[:5],
+                "optimization_tips": self._first_unique(opt_tips, 5),
                 "virality_score": score,
             }
 
@@ -113,17 +126,33 @@ class OptimizationAgent(BaseAgent):
     # HELPERS
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _first_unique(items: List[str], limit: int) -> List[str]:
+        """First `limit` distinct items in order, stopping as soon as they are found."""
+        seen = set()
+        unique: List[str] = []
+        for item in items:
+            if item in seen:
+                continue
+            seen.add(item)
+            unique.append(item)
+            if len(unique) == limit:
+                break
+        return unique
+
     def _optimize_hashtags(self, hashtags: str, variants: Dict, strategy: Dict) -> str:
         """Keep 5-8 best hashtags."""
-        tags = hashtags.split()
+        # dict as an ordered set: O(1) membership, first-seen order kept
+        tags = dict.fromkeys(hashtags.split())
         # Add strategy-based tags
         pillars = strategy.get("content_pillars", [])
-        for pillar in pillars[:2]:
-            tag = f"#{pillar.replace(' ', '').capitalize()}"
-            if tag not in tags:
-                tags.append(tag)
+        pillar_tags = [f"#{p.translate(_STRIP_SPACE).capitalize()}" for p in pillars[:2]]
+        for tag in pillar_tags:
+            if len(tags) >= 8:
+                break
+            tags.setdefault(tag, None)
         # Limit to 8
-        return " ".join(tags[:8])
+        return " ".join(list(tags)[:8])
 
     def _build_recommendations(
         self, opt_data: Dict, best_variant: str, strategy: Dict
@@ -6,11 +6,35 @@ Uses TrendAnalyzer and web research to gather market intelligence,
 trending topics, and hashtag recommendations.
 """
 
+import contextvars
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
-from agents.base_agent import AgentResult, BaseAgent
-from tools.trend_analyzer import TrendAnalyzer
+from agents.base_agent import PARTIAL_OUTPUT, AgentResult, BaseAgent
+from tools.semantic_cache import SemanticCache
+from tools.trend_analyzer import TrendAnalysisResult, TrendAnalyzer
+from utils.cache import SimpleCache
+
+# (competitor_insights, content_gaps) per topic, shared across workflows;
+# near-identical topics ("AI tools" / "AI tooling") reuse one entry
+_INSIGHTS_CACHE = SemanticCache(threshold=0.92)
+
+# Successful trend analyses keyed by normalized topic. Trends go stale, so
+# entries expire after an hour.
+_TREND_CACHE = SimpleCache(max_size=256, default_ttl=3600)
+_TREND_CACHE_LOCK = threading.Lock()
+
+
+def _worker_context() -> contextvars.Context:
+    """
+    The current context (so the agent's deadline reaches the worker) minus
+    partial output: two concurrent streams would garble one status line.
+    """
+    ctx = contextvars.copy_context()
+    ctx.run(PARTIAL_OUTPUT.set, None)
+    return ctx
 
 
 class ResearchAgent(BaseAgent):
@@ -42,28 +66,43 @@ class ResearchAgent(BaseAgent):
             return self._failure("No topic available for research", time.time() - start)
 
         # 1. Trend analysis
-        trend_result = self.trend_analyzer.analyze(topic)
+        trend_result = self._analyze_trends(topic)
 
         # 2. If LLM available — deeper market intelligence
         competitor_insights = ""
         content_gaps = ""
         if self.llm:
-            competitor_insights = self.think(
-                prompt=(
-                    f"Topic: {topic}\n"
-                    f"What content about this topic performs best on LinkedIn right now? "
-                    f"Give 3 insights about what the audience currently craves."
-                ),
-                system_prompt="You are a LinkedIn content market researcher.",
-            )
-            content_gaps = self.think(
-                prompt=(
-                    f"Topic: {topic}\n"
-                    f"What angles or perspectives are under-represented on LinkedIn for this topic? "
-                    f"Give 3 content gap opportunities."
-                ),
-                system_prompt="You are a content strategy expert.",
-            )
+            cached, topic_vector = _INSIGHTS_CACHE.lookup(topic)
+            if cached is not None:
+                competitor_insights, content_gaps = cached
+                self.logger.info("🎯 Reusing market intelligence for a similar topic")
+            else:
+                # Independent questions — ask both at once
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    insights_future = pool.submit(
+                        _worker_context().run,
+                        self.think,
+                        prompt=(
+                            f"Topic: {topic}\n"
+                            f"What content about this topic performs best on LinkedIn right now? "
+                            f"Give 3 insights about what the audience currently craves."
+                        ),
+                        system_prompt="You are a LinkedIn content market researcher.",
+                    )
+                    gaps_future = pool.submit(
+                        _worker_context().run,
+                        self.think,
+                        prompt=(
+                            f"Topic: {topic}\n"
+                            f"What angles or perspectives are under-represented on LinkedIn for this topic? "
+                            f"Give 3 content gap opportunities."
+                        ),
+                        system_prompt="You are a content strategy expert.",
+                    )
+                    competitor_insights = insights_future.result()
+                    content_gaps = gaps_future.result()
+                if competitor_insights and content_gaps:
+                    _INSIGHTS_CACHE.store(topic, (competitor_insights, content_gaps), topic_vector)
 
         output = {
             "topic": topic,
@@ -90,3 +129,21 @@ class ResearchAgent(BaseAgent):
             next_hint="ContentIntelligenceAgent",
             time=time.time() - start,
         )
+
+    # ------------------------------------------------------------------
+    # HELPERS
+    # ------------------------------------------------------------------
+
+    def _analyze_trends(self, topic: str) -> TrendAnalysisResult:
+        """TrendAnalyzer.analyze behind a 1h cache keyed on the normalized topic."""
+        key = topic.strip().lower()
+        with _TREND_CACHE_LOCK:
+            cached = _TREND_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        result = self.trend_analyzer.analyze(topic)
+        if result.success:
+            with _TREND_CACHE_LOCK:
+                _TREND_CACHE.set(key, result)
+        return result
@@ -8,6 +8,12 @@ import os
 import sys
 import streamlit as st
 import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 
 # Load environment variables from .env file
@@ -22,45 +28,132 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Core imports
 from core.generator import LinkedInGenerator
-from core.models import PostRequest, ContentType, Tone, Audience, GenerationMode
-
-# Quality chains for post improvement (lazy load to avoid import issues)
-try:
-    from chains.quality_chains import (
-        enforce_specificity,
-        score_post_quality,
-        generate_hook_options,
-        ground_in_context
-    )
-    QUALITY_CHAINS_AVAILABLE = True
-except ImportError as e:
-    logger = __import__('utils.logger', fromlist=['get_logger']).get_logger(__name__)
-    logger.warning(f"⚠️ Quality chains unavailable: {e}")
-    QUALITY_CHAINS_AVAILABLE = False
-    
-    # Provide no-op functions if import fails
-    def enforce_specificity(post): return post
-    def score_post_quality(post): return None
-    def generate_hook_options(post, context="", tone="", audience=""): return None
-    def ground_in_context(post, context): return post
+from core.models import PostRequest, ContentType, Tone, Audience, GenerationMode, MultiModalInput
 
 # UI imports
 from ui.components import UIComponents
 from ui.styles import setup_page_config, apply_custom_css, render_loading_animation, render_inline_loader
 
-# Agentic Studio imports (lazy — only fail at use-time if missing)
-try:
-    from ui.multi_modal_input import render_multi_modal_input
-    from ui.agent_dashboard import render_agent_dashboard, update_agent_status, render_agentic_results
-    from core.models import MultiModalInput
-    AGENTIC_UI_AVAILABLE = True
-except ImportError as _agentic_import_err:
-    AGENTIC_UI_AVAILABLE = False
-
 # Utils
 from utils.logger import get_logger
 from utils.exceptions import LinkedInGeneratorError, format_error_for_user
 
+# Post type radio options; the first two map straight to a generation mode
+POST_TYPES = (
+    "🚀 SIMPLE Topic",
+    "📊 ADVANCED GitHub",
+    "🏆 HACKATHON Project",
+    "🤖 AGENTIC Studio",
+)
+POST_TYPE_MODES = {
+    "🚀 SIMPLE Topic": GenerationMode.SIMPLE,
+    "📊 ADVANCED GitHub": GenerationMode.ADVANCED,
+}
+
+# Generations remembered per session for the sidebar history (it shows 5)
+CHAT_HISTORY_LIMIT = 20
+
+# advanced_options keys that turn on a quality chain, with their defaults
+QUALITY_OPTION_DEFAULTS = {
+    "enforce_specificity": True,
+    "ground_claims": True,
+    "generate_hook_options": False,
+}
+
+# Per-session state, as key -> factory so mutable defaults aren't shared
+SESSION_STATE_DEFAULTS = {
+    "posts_generated": int,
+    "current_response": lambda: None,
+    "generation_count": int,
+    "agentic_response": lambda: None,
+    "show_scheduler": bool,
+    "dark_mode": bool,
+    "chat_history": lambda: deque(maxlen=CHAT_HISTORY_LIMIT),
+    "session_id": lambda: uuid.uuid4().hex,
+}
+
+
+@lru_cache(maxsize=None)
+def _load_quality_chains():
+    """Import the quality chains on first use; None if they fail to load."""
+    try:
+        from chains import quality_chains
+    except ImportError as e:
+        get_logger(__name__).warning(f"⚠️ Quality chains unavailable: {e}")
+        return None
+    return quality_chains
+
+
+@lru_cache(maxsize=None)
+def _load_agentic_ui():
+    """Import the Agentic Studio UI on first use; None if it fails to load."""
+    try:
+        from ui.multi_modal_input import render_multi_modal_input
+        from ui.agent_dashboard import render_agent_dashboard, update_agent_status, render_agentic_results
+    except ImportError as e:
+        get_logger(__name__).warning(f"⚠️ Agentic UI unavailable: {e}")
+        return None
+    return render_multi_modal_input, render_agent_dashboard, update_agent_status, render_agentic_results
+
+
+# st.fragment (Streamlit 1.37+, experimental_fragment from 1.33) reruns only
+# the decorated function when a widget inside it changes. The pinned
+# Streamlit predates both, so fall back to a plain call there.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _score_post(post: str):
+    """Quality score for a post; cached so reopening the panel never re-asks the LLM."""
+    quality = _load_quality_chains()
+    return quality.score_post_quality(post) if quality is not None else None
+
+
+@_fragment
+def _render_results_panel(response):
+    """Post output panel; its widgets (hook picker, editor, copy/export) rerun only this panel."""
+    UIComponents.render_post_output(response)
+
+    # Scoring is informational only, so it runs on request instead of
+    # holding up generation
+    if response.success and st.session_state.get("show_quality_score", True):
+        with st.expander("📊 Quality Analysis"):
+            if not response.quality_score and st.button("📊 Score this post", key="btn_score_post"):
+                with st.spinner("📊 Scoring post quality..."):
+                    try:
+                        response.quality_score = _score_post(response.post)
+                    except Exception as e:
+                        get_logger(__name__).error(f"⚠️ Quality scoring failed: {e}")
+                        st.warning("Quality scoring is unavailable right now.")
+            if response.quality_score:
+                UIComponents.render_quality_analysis(response.quality_score)
+
+
+@_fragment
+def _render_agentic_results_panel(render_agentic_results, response, generator):
+    """Agentic results panel; its per-variant copy/post/schedule widgets rerun only this panel."""
+    render_agentic_results(response, generator=generator)
+
+
+@contextmanager
+def _generation_progress(text: str):
+    """Progress bar + live-text placeholder, cleared on exit even if generation raises."""
+    progress_bar = st.progress(0, text=text)
+    live_text = st.empty()
+    try:
+        yield progress_bar, live_text
+    finally:
+        progress_bar.empty()
+        live_text.empty()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_generator() -> LinkedInGenerator:
+    """Build the generator once per process; reruns and sessions share it."""
+    generator = LinkedInGenerator()
+    generator.warm_up()
+    return generator
+
 
 class LinkedInPostApp:
     """Main application class for LinkedIn post generation."""
@@ -71,7 +164,7 @@ class LinkedInPostApp:
         
         # Initialize generator
         try:
-            self.generator = LinkedInGenerator()
+            self.generator = _get_generator()
             self.logger.info("✅ LinkedIn generator initialized")
         except Exception as e:
             self.logger.error(f"❌ Failed to initialize generator: {e}")
@@ -85,26 +178,26 @@ class LinkedInPostApp:
         
         # Initialize session state
         self._init_session_state()
+
+        # Without a generator nothing below is usable — skip building it
+        if not self.generator:
+            self._render_error_screen()
+            return
         
         # Render UI
         self._render_app()
+
+    def _render_error_screen(self):
+        """Render the configuration-error screen shown when the generator failed to start."""
+        UIComponents.render_header()
+        st.error("❌ Generator not available. Please check your configuration.")
+        st.info("💡 Make sure you have GROQ_API_KEY set in your .env file")
     
     def _init_session_state(self):
         """Initialize Streamlit session state."""
-        if 'posts_generated' not in st.session_state:
-            st.session_state.posts_generated = 0
-        if 'current_response' not in st.session_state:
-            st.session_state.current_response = None
-        if 'generation_count' not in st.session_state:
-            st.session_state.generation_count = 0
-        if 'agentic_response' not in st.session_state:
-            st.session_state.agentic_response = None
-        if 'show_scheduler' not in st.session_state:
-            st.session_state.show_scheduler = False
-        if 'dark_mode' not in st.session_state:
-            st.session_state.dark_mode = False
-        if 'chat_history' not in st.session_state:
-            st.session_state.chat_history = []
+        missing = SESSION_STATE_DEFAULTS.keys() - st.session_state.keys()
+        if missing:
+            st.session_state.update({key: SESSION_STATE_DEFAULTS[key]() for key in missing})
     
     def _render_app(self):
         """Render the main application interface."""
@@ -120,20 +213,10 @@ class LinkedInPostApp:
     def _render_main_content(self):
         """Render the main content generation interface."""
         
-        if not self.generator:
-            st.error("❌ Generator not available. Please check your configuration.")
-            st.info("💡 Make sure you have GROQ_API_KEY set in your .env file")
-            return
-        
         # Post Type Selection (Top Level)
         post_type = st.radio(
             "📝 Select Post Type",
-            [
-                "🚀 SIMPLE Topic",
-                "📊 ADVANCED GitHub",
-                "🏆 HACKATHON Project",
-                "🤖 AGENTIC Studio",
-            ],
+            POST_TYPES,
             horizontal=True,
         )
         
@@ -154,7 +237,14 @@ class LinkedInPostApp:
                 with st.spinner("🚀 Creating your hackathon story..."):
                     start_time = time.time()
                     
-                    response = self.generator.generate_hackathon_post(hackathon_request)
+                    live_post = st.empty()
+                    try:
+                        response = self.generator.generate_hackathon_post(
+                            hackathon_request,
+                            partial_callback=lambda text: live_post.markdown(text),
+                        )
+                    finally:
+                        live_post.empty()
                     elapsed = time.time() - start_time
                     
                     st.markdown("---")
@@ -207,7 +297,7 @@ class LinkedInPostApp:
             return  # Exit early for hackathon posts
         
         # Regular flow for SIMPLE and ADVANCED modes
-        mode = GenerationMode.SIMPLE if post_type == "🚀 SIMPLE Topic" else GenerationMode.ADVANCED
+        mode = POST_TYPE_MODES[post_type]
         
         # Generation mode
         # mode = UIComponents.render_mode_selector()  # Commented out - now set by post_type
@@ -218,6 +308,15 @@ class LinkedInPostApp:
         # Input section
         github_url, topic, text_input, user_key_message = UIComponents.render_input_section(mode)
 
+        # Fetch the repo while the user is still picking style and options
+        if (
+            github_url
+            and github_url != st.session_state.get("prefetched_url")
+            and PostRequest._is_valid_github_url(github_url)
+        ):
+            st.session_state.prefetched_url = github_url
+            self.generator.prefetch_repo(github_url)
+
         # Tagging section
         tags_people, tags_organizations = UIComponents.render_tagging_section()
 
@@ -245,7 +344,7 @@ class LinkedInPostApp:
         
         # Display results
         if st.session_state.current_response:
-            UIComponents.render_post_output(st.session_state.current_response)
+            _render_results_panel(st.session_state.current_response)
     
     # ------------------------------------------------------------------
     # AGENTIC STUDIO
@@ -253,13 +352,11 @@ class LinkedInPostApp:
 
     def _render_agentic_studio(self):
         """Render the 6-agent AI Content Studio workflow."""
-        if not AGENTIC_UI_AVAILABLE:
+        agentic_ui = _load_agentic_ui()
+        if agentic_ui is None:
             st.error("⚠️ Agentic UI modules failed to load. Check imports.")
             return
-
-        if not self.generator:
-            st.error("❌ Generator not available. Check your GROQ_API_KEY.")
-            return
+        render_multi_modal_input, render_agent_dashboard, update_agent_status, render_agentic_results = agentic_ui
 
         st.markdown('<h2 class="gradient-title gradient-title-md">' 
                     '<span class="gt-icon">🤖</span> Agentic AI Content Studio</h2>', unsafe_allow_html=True)
@@ -325,16 +422,17 @@ class LinkedInPostApp:
             except Exception as e:
                 self.logger.error(f"Agentic pipeline error: {e}")
                 st.error(f"❌ Pipeline failed: {e}")
-                if st.checkbox("🔧 Show debug info", key="agentic_debug"):
+                with st.expander("🔧 Show debug info"):
                     st.exception(e)
                 return
 
         # Render previously-generated agentic results
         if st.session_state.get("agentic_response"):
             st.markdown("---")
-            render_agentic_results(
+            _render_agentic_results_panel(
+                render_agentic_results,
                 st.session_state.agentic_response,
-                generator=self.generator,
+                self.generator,
             )
 
             if st.button("🔄 Generate Again", key="agentic_reset"):
@@ -381,72 +479,103 @@ class LinkedInPostApp:
                 max_length=advanced_options.get("max_length", 2000)
             )
             
-            # Show progress
+            # Show progress — driven by the generator's real milestones
             with st.spinner("🎯 Generating your LinkedIn post..."):
                 start_time = time.time()
                 
-                # Generate post
-                response = self.generator.generate(request)
-                
-                # Apply quality improvements if enabled
-                if response.success and QUALITY_CHAINS_AVAILABLE:
-                    has_context = bool(response.context_sources)
-                    
-                    # Enforce specificity if enabled
-                    if advanced_options.get("enforce_specificity", True):
-                        try:
-                            with st.spinner("🔍 Enforcing specificity..."):
-                                improved_post = enforce_specificity(response.post)
-                                if improved_post and improved_post != response.post:
-                                    response.post = improved_post
-                                    self.logger.info("✅ Specificity enforcement applied")
-                        except Exception as e:
-                            self.logger.error(f"⚠️ Specificity enforcement failed: {e}")
-                    
-                    # Ground claims in context if enabled and context available
-                    if advanced_options.get("ground_claims", True) and has_context:
-                        try:
-                            with st.spinner("✓ Verifying claims against context..."):
-                                grounded_post = ground_in_context(response.post, "\n".join(response.context_sources))
-                                if grounded_post and grounded_post != response.post:
-                                    response.post = grounded_post
+                # Generate post, rendering the text as it streams in
+                with _generation_progress("🎯 Generating your LinkedIn post...") as (progress_bar, live_post):
+                    response = self.generator.generate(
+                        request,
+                        progress_callback=lambda pct, msg: progress_bar.progress(pct, text=msg),
+                        partial_callback=lambda text: live_post.markdown(text),
+                        use_cache=not advanced_options.get("no_cache", False),
+                        refresh=st.session_state.pop("bypass_response_cache", False),
+                        session_id=st.session_state.session_id,
+                    )
+
+                    # Apply quality improvements if enabled — still inside the
+                    # progress block so the streamed draft stays on screen
+                    quality = None
+                    if response.success and any(
+                        advanced_options.get(key, default) for key, default in QUALITY_OPTION_DEFAULTS.items()
+                    ):
+                        quality = _load_quality_chains()
+
+                    if quality is not None:
+                        has_context = bool(response.context_sources)
+                        grounding_context = "\n".join(response.context_sources)
+
+                        def wants_grounding(post: str) -> bool:
+                            return (
+                                advanced_options.get("ground_claims", True)
+                                and has_context
+                                and quality.needs_grounding(post, grounding_context)
+                            )
+
+                        # Enforce specificity if enabled
+                        # Cheap local pre-checks skip the LLM when the post already passes
+                        grounded = False
+                        if advanced_options.get("enforce_specificity", True) and quality.needs_specificity(response.post):
+                            # Grounding due as well: one combined rewrite instead of two sequential calls
+                            combined = wants_grounding(response.post)
+                            try:
+                                with st.spinner("🔍 Enforcing specificity..."):
+                                    if combined:
+                                        improved_post = quality.refine_in_context(response.post, grounding_context)
+                                    else:
+                                        improved_post = quality.enforce_specificity(response.post)
+                                    if improved_post and improved_post != response.post:
+                                        response.post = improved_post
+                                        self.logger.info("✅ Specificity enforcement applied")
+                                grounded = combined
+                            except Exception as e:
+                                self.logger.error(f"⚠️ Specificity enforcement failed: {e}")
+
+                        # Grounding and hook options are independent LLM calls on
+                        # the same post — run them concurrently
+                        jobs = {}
+                        with ThreadPoolExecutor(max_workers=2) as pool:
+                            if not grounded and wants_grounding(response.post):
+                                jobs["grounding"] = pool.submit(
+                                    quality.ground_in_context, response.post, grounding_context
+                                )
+                            if advanced_options.get("generate_hook_options", False) and mode == GenerationMode.SIMPLE:
+                                jobs["hook options"] = pool.submit(quality.generate_hook_options, response.post)
+
+                            if jobs:
+                                with st.spinner("✨ Grounding claims and drafting hooks..."):
+                                    wait(jobs.values())
+
+                        for step, future in jobs.items():
+                            try:
+                                result = future.result()
+                            except Exception as e:
+                                self.logger.error(f"⚠️ {step.capitalize()} failed: {e}")
+                                continue
+                            if not result:
+                                continue
+                            if step == "grounding":
+                                if result != response.post:
+                                    response.post = result
                                     self.logger.info("✅ Context grounding applied")
-                        except Exception as e:
-                            self.logger.error(f"⚠️ Context grounding failed: {e}")
-                    
-                    # Generate hook options if enabled and simple mode
-                    if advanced_options.get("generate_hook_options", False) and mode == GenerationMode.SIMPLE:
-                        try:
-                            with st.spinner("🎣 Generating hook options..."):
-                                hook_options = generate_hook_options(response.post)
-                                if hook_options:
-                                    response.hook_options = hook_options
-                                    self.logger.info("✅ Hook options generated")
-                        except Exception as e:
-                            self.logger.error(f"⚠️ Hook generation failed: {e}")
-                    
-                    # Score post quality if enabled
-                    if advanced_options.get("show_quality_score", True):
-                        try:
-                            with st.spinner("📊 Scoring post quality..."):
-                                quality_score = score_post_quality(response.post)
-                                if quality_score:
-                                    response.quality_score = quality_score
-                                    self.logger.info("✅ Quality score calculated")
-                        except Exception as e:
-                            self.logger.error(f"⚠️ Quality scoring failed: {e}")
+                            else:
+                                response.hook_options = result
+                                self.logger.info("✅ Hook options generated")
                 
-                # Update session state
-                st.session_state.current_response = response
-                st.session_state.posts_generated += 1
-                st.session_state.generation_count += 1
-
-                # Track in chat history
-                import datetime as _dt
+                # Track in chat history (bounded deque — oldest entries drop off)
                 st.session_state.chat_history.append({
                     "topic": topic or github_url or text_input[:40] or "Post",
                     "mode": mode.value,
-                    "time": _dt.datetime.now().strftime("%H:%M"),
+                    "time": datetime.now().strftime("%H:%M"),
+                })
+
+                # Update session state in one write
+                st.session_state.update({
+                    "current_response": response,
+                    "show_quality_score": advanced_options.get("show_quality_score", True),
+                    "posts_generated": st.session_state.posts_generated + 1,
+                    "generation_count": st.session_state.generation_count + 1,
                 })
                 
                 # Log generation
@@ -471,7 +600,7 @@ class LinkedInPostApp:
             st.error("❌ Something went wrong. Please try again.")
             
             # Show debug info in development
-            if st.checkbox("🔧 Show debug info"):
+            with st.expander("🔧 Show debug info"):
                 st.exception(e)
 
 
@@ -486,7 +615,7 @@ def main():
         st.info("💡 Please check your configuration and try again.")
         
         # Show debug info
-        if st.checkbox("🔧 Show debug info"):
+        with st.expander("🔧 Show debug info"):
             st.exception(e)
 
 
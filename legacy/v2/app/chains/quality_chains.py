@@ -6,57 +6,85 @@ Quality improvement chains for LinkedIn post generation.
 Adds specificity, grounds claims in context, and scores post quality.
 """
 
+import re
+import threading
+from functools import lru_cache
+from itertools import islice
+
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnablePassthrough
-from core.llm import get_llm_deterministic, get_llm
+from core.llm import get_llm_deterministic, get_llm_instant, get_llm
 
 # ============================================================================
 # LAZY CHAIN INITIALIZATION
 # ============================================================================
-# Chains are created on first use, not at module import time.
-# This prevents unnecessary API connections during imports.
+# Prompt templates are parsed once at import (next to each prompt below);
+# chains bind them to the LLM on first use, so importing opens no API
+# connection. The lock keeps concurrent first calls from each building
+# the same chain.
+
+_chain_lock = threading.Lock()
+
+# Output caps for the fixed-format chains (rewrites keep the full budget)
+QUALITY_SCORE_MAX_TOKENS = 400
+HOOK_OPTIONS_MAX_TOKENS = 300
 
 _specificity_enforcer = None
 _quality_scorer = None
 _hook_generator = None
 _context_grounder = None
+_post_refiner = None
+
+def _text(result) -> str:
+    """Text of a chain result: the message content for chat models, str() otherwise."""
+    return result.content if isinstance(result, BaseMessage) else str(result)
 
 def _get_specificity_enforcer():
     """Get or create specificity enforcer chain."""
     global _specificity_enforcer
     if _specificity_enforcer is None:
-        prompt = PromptTemplate.from_template(SPECIFICITY_CHECK_PROMPT)
-        llm = get_llm_deterministic()
-        _specificity_enforcer = prompt | llm
+        with _chain_lock:
+            if _specificity_enforcer is None:
+                _specificity_enforcer = _SPECIFICITY_TEMPLATE | get_llm_deterministic()
     return _specificity_enforcer
 
 def _get_quality_scorer():
     """Get or create quality scorer chain."""
     global _quality_scorer
     if _quality_scorer is None:
-        prompt = PromptTemplate.from_template(QUALITY_SCORE_PROMPT)
-        llm = get_llm_deterministic()
-        _quality_scorer = prompt | llm
+        with _chain_lock:
+            if _quality_scorer is None:
+                _quality_scorer = _QUALITY_SCORE_TEMPLATE | get_llm_instant(QUALITY_SCORE_MAX_TOKENS)
     return _quality_scorer
 
 def _get_hook_generator():
     """Get or create hook generator chain."""
     global _hook_generator
     if _hook_generator is None:
-        prompt = PromptTemplate.from_template(HOOK_OPTIONS_PROMPT)
-        llm = get_llm_deterministic()
-        _hook_generator = prompt | llm
+        with _chain_lock:
+            if _hook_generator is None:
+                _hook_generator = _HOOK_OPTIONS_TEMPLATE | get_llm_instant(HOOK_OPTIONS_MAX_TOKENS)
     return _hook_generator
 
 def _get_context_grounder():
     """Get or create context grounder chain."""
     global _context_grounder
     if _context_grounder is None:
-        prompt = PromptTemplate.from_template(CONTEXT_GROUNDING_PROMPT)
-        llm = get_llm_deterministic()
-        _context_grounder = prompt | llm
+        with _chain_lock:
+            if _context_grounder is None:
+                _context_grounder = _CONTEXT_GROUNDING_TEMPLATE | get_llm_deterministic()
     return _context_grounder
 
+def _get_post_refiner():
+    """Get or create combined specificity + grounding chain."""
+    global _post_refiner
+    if _post_refiner is None:
+        with _chain_lock:
+            if _post_refiner is None:
+                _post_refiner = _REFINE_IN_CONTEXT_TEMPLATE | get_llm_deterministic()
+    return _post_refiner
+
 
 # ============================================================================
 # 1. SPECIFICITY ENFORCER CHAIN
@@ -96,11 +124,36 @@ QUALITY CHECKLIST:
 
 IMPROVE NOW (return clean post only):"""
 
+_SPECIFICITY_TEMPLATE = PromptTemplate.from_template(SPECIFICITY_CHECK_PROMPT)
+
+# Concrete details: figures (42%, $2M, 3x, 1,200) and list/step items
+_SPECIFIC_MARKER_RE = re.compile(
+    r"\d+(?:[.,]\d+)*\s*(?:%|x\b)|\$\d|\b\d{2,}\b|^\s*(?:\d+[.)]|[•\-–*→])\s",
+    re.MULTILINE,
+)
+_VAGUE_PHRASE_RE = re.compile(
+    r"\b(?:it was (?:great|amazing|awesome)|game[- ]changer|a lot of|very important|"
+    r"really (?:good|great)|things like that)\b",
+    re.IGNORECASE,
+)
+# Generation prompts already carry core.prompts.SPECIFICITY_RULES, so the
+# rewrite is a fallback for posts with vague phrasing or no concrete detail
+SPECIFICITY_MARKERS_MIN = 1
+
+@lru_cache(maxsize=128)
+def needs_specificity(post: str) -> bool:
+    """Cheap pre-check: False when the post is already concrete enough to skip the LLM pass."""
+    if _VAGUE_PHRASE_RE.search(post):
+        return True
+    # Stop scanning once enough markers are found instead of collecting them all
+    found = sum(1 for _ in islice(_SPECIFIC_MARKER_RE.finditer(post), SPECIFICITY_MARKERS_MIN))
+    return found < SPECIFICITY_MARKERS_MIN
+
 def enforce_specificity(post: str) -> str:
     """Improve post specificity and ground it in reality."""
     chain = _get_specificity_enforcer()
     result = chain.invoke({"post": post})
-    return result.content if hasattr(result, 'content') else str(result)
+    return _text(result)
 
 # ============================================================================
 # 2. QUALITY SCORER CHAIN
@@ -158,11 +211,13 @@ Overall: [AVERAGE]/10
 
 TOP IMPROVEMENT: [1 specific thing that would most improve this post]"""
 
+_QUALITY_SCORE_TEMPLATE = PromptTemplate.from_template(QUALITY_SCORE_PROMPT)
+
 def score_post_quality(post: str) -> str:
     """Score post on multiple quality dimensions."""
     chain = _get_quality_scorer()
     result = chain.invoke({"post": post})
-    return result.content if hasattr(result, 'content') else str(result)
+    return _text(result)
 
 # ============================================================================
 # 3. HOOK GENERATOR CHAIN (3 options)
@@ -213,6 +268,8 @@ Hook #2 (Outcome):
 Hook #3 (Contrarian):
 [hook text]"""
 
+_HOOK_OPTIONS_TEMPLATE = PromptTemplate.from_template(HOOK_OPTIONS_PROMPT)
+
 def generate_hook_options(post: str, context: str = "", tone: str = "professional", audience: str = "technical") -> str:
     """Generate 3 different hook options for the post.
     
@@ -232,7 +289,7 @@ def generate_hook_options(post: str, context: str = "", tone: str = "professiona
         "tone": tone,
         "audience": audience
     })
-    return result.content if hasattr(result, 'content') else str(result)
+    return _text(result)
 
 # ============================================================================
 # 4. CONTEXT GROUNDING CHAIN
@@ -277,6 +334,20 @@ If the post is already grounded in context with no hallucinations, return it as-
 
 Write the final post now (clean output only):"""
 
+_CONTEXT_GROUNDING_TEMPLATE = PromptTemplate.from_template(CONTEXT_GROUNDING_PROMPT)
+
+_WORD_RE = re.compile(r"[a-z0-9]{4,}")
+GROUNDED_OVERLAP_MIN = 0.3
+
+@lru_cache(maxsize=128)
+def needs_grounding(post: str, context: str) -> bool:
+    """Cheap pre-check: False when most of the post's words already appear in the context."""
+    post_words = set(_WORD_RE.findall(post.lower()))
+    if not post_words:
+        return False
+    context_words = set(_WORD_RE.findall(context.lower()))
+    return len(post_words & context_words) / len(post_words) < GROUNDED_OVERLAP_MIN
+
 def ground_in_context(post: str, context: str) -> str:
     """Ground post claims in provided context, remove hallucinations."""
     chain = _get_context_grounder()
@@ -284,7 +355,48 @@ def ground_in_context(post: str, context: str) -> str:
         "post": post,
         "context": context
     })
-    return result.content if hasattr(result, 'content') else str(result)
+    return _text(result)
+
+# When a post needs both passes, one rewrite does the work of
+# enforce_specificity + ground_in_context: one round-trip, and the post
+# is sent once instead of twice.
+REFINE_IN_CONTEXT_PROMPT = """You are an editor improving a LinkedIn post for SPECIFICITY while keeping it GROUNDED in verified context.
+
+POST:
+{post}
+
+CONTEXT (VERIFIED INFORMATION ONLY):
+{context}
+
+---
+
+SPECIFICITY:
+1. Replace vague phrases with concrete, practical HOW-TO details and frameworks
+2. Remove generic filler lines
+3. Keep the same length (max 5% longer), emotional core and conversational tone
+
+GROUNDING:
+1. Any number/% or specific metric not in context? → REMOVE IT
+2. "Studies show", "research indicates" without source? → REMOVE IT
+3. Made-up timelines, costs or before/after comparisons? → REMOVE IT
+4. Replace invented numbers with qualitative explanations from the context
+
+---
+
+Return ONLY the improved post text - no meta-commentary, explanations or labels.
+
+Write the final post now (clean output only):"""
+
+_REFINE_IN_CONTEXT_TEMPLATE = PromptTemplate.from_template(REFINE_IN_CONTEXT_PROMPT)
+
+def refine_in_context(post: str, context: str) -> str:
+    """Enforce specificity and ground claims in context with a single LLM call."""
+    chain = _get_post_refiner()
+    result = chain.invoke({
+        "post": post,
+        "context": context
+    })
+    return _text(result)
 
 # ============================================================================
 # 5. COMPLETE QUALITY IMPROVEMENT PIPELINE
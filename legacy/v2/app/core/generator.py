@@ -3,18 +3,39 @@ LinkedIn Content Generator - Core Brain
 Clean, production-ready architecture.
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from contextlib import closing
+from dataclasses import dataclass, replace
 from datetime import datetime
 import logging
+import threading
+import time
 
 from .prompts import PromptBuilder
 from .models import (
-    PostRequest, PostResponse, GenerationMode,
+    PostRequest, PostResponse, GenerationMode, LLMResult,
     MultiModalInput, AgenticWorkflowRequest, AgenticWorkflowResponse,
 )
 from .rag import RAGEngine
-from .llm import LLMProvider
+from .llm import get_provider
+from tools.semantic_cache import SemanticCache
+from utils.cache import SimpleCache
+
+# Identical requests within this window reuse the previous post
+RESPONSE_CACHE_TTL = 3600
+RESPONSE_CACHE_SIZE = 128
+
+# Paraphrased topic/text with otherwise identical settings also reuses it
+SEMANTIC_RESPONSE_THRESHOLD = 0.92
+
+# (percent 0-100, message) — invoked at real generation milestones
+ProgressCallback = Callable[[int, str], None]
+
+# Receives the post text generated so far while the LLM streams
+PartialCallback = Callable[[str], None]
+
+# Minimum seconds between partial-text callbacks (bounds UI re-renders)
+PARTIAL_CALLBACK_INTERVAL = 0.2
 
 
 # ===============================
@@ -52,7 +73,7 @@ class LinkedInGenerator:
         # ---- LLM INIT ----
         try:
             self.logger.info("🔄 Initializing LLM provider...")
-            self.llm = LLMProvider()
+            self.llm = get_provider()
             self.llm_available = True
             self.logger.info("✅ LLM provider ready")
         except Exception as e:
@@ -67,9 +88,52 @@ class LinkedInGenerator:
         self.rag_available = False
         self._rag_init_attempted = False
 
+        # Successful responses keyed by PostRequest.cache_key(), plus a
+        # semantic tier over the free-text inputs within cache_namespace()
+        self._response_cache = SimpleCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+        self._response_cache_lock = threading.Lock()
+        self._semantic_cache = SemanticCache(
+            SEMANTIC_RESPONSE_THRESHOLD, RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL,
+        )
+
         # Metrics
         self.generation_count = 0
         self.total_generation_time = 0
+
+    def warm_up(self) -> Optional[threading.Thread]:
+        """
+        Open the LLM connection and load the embedding model in the
+        background, so the first real generation pays neither the TCP/TLS
+        handshake nor the model's cold first encodes. Returns the thread.
+        """
+        if not self.llm_available or not self.llm:
+            return None
+        thread = threading.Thread(target=self._warm_up, name="llm-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def _warm_up(self):
+        self.llm.test_connectivity()
+        RAGEngine.warm_up()
+
+    def prefetch_repo(self, github_url: str) -> threading.Thread:
+        """
+        Load a repository's context in the background as soon as its URL
+        is entered. The loader caches successful loads, so the fetch is
+        off the critical path by the time Generate is clicked. Returns the thread.
+        """
+        thread = threading.Thread(
+            target=self._prefetch_repo, args=(github_url,), name="repo-prefetch", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _prefetch_repo(self, github_url: str):
+        from loaders.github_loader import GitHubLoader
+        try:
+            GitHubLoader().load_with_fallback(github_url)
+        except Exception as e:
+            self.logger.debug(f"Repo prefetch failed: {e}")
     
     def _ensure_rag_initialized(self):
         """Lazy RAG initialization - only loads when actually needed."""
@@ -94,7 +158,102 @@ class LinkedInGenerator:
     # PUBLIC GENERATE
     # ===============================
 
-    def generate(self, request: PostRequest) -> PostResponse:
+    def generate(
+        self,
+        request: PostRequest,
+        progress_callback: Optional[ProgressCallback] = None,
+        partial_callback: Optional[PartialCallback] = None,
+        use_cache: bool = True,
+        refresh: bool = False,
+        session_id: str = "",
+    ) -> PostResponse:
+        """
+        Generate a post, reusing the response to an identical earlier request
+        or one whose topic/text means the same with identical settings.
+        Pass use_cache=False to neither read nor store cached posts, or
+        refresh=True to skip the lookup and replace the cached post.
+
+        Exact hits are shared by everyone (the caller supplied the same
+        inputs); near-matches only come from the same session_id, so one
+        user's text never resurfaces in another user's post.
+
+        With partial_callback set the LLM call is streamed and the callback
+        receives the text so far, so the UI can render before completion.
+        """
+        if not use_cache:
+            return self._generate(request, progress_callback, partial_callback)
+
+        key = request.cache_key()
+        namespace = f"{session_id}:{request.cache_namespace()}"
+        cached = vector = None
+        if not refresh:
+            with self._response_cache_lock:
+                cached = self._response_cache.get(key)
+        if cached is None and not refresh:
+            cached, vector = self._semantic_cache.lookup(request.semantic_text(), namespace)
+        if cached is not None:
+            self.logger.info("🎯 Response cache hit")
+            self._report(progress_callback, 100, "Reused a recent post for the same request")
+            # Callers post-process the response in place — hand out a copy
+            return replace(
+                cached,
+                context_sources=list(cached.context_sources),
+                hook_options={},
+                quality_score={},
+            )
+
+        response = self._generate(request, progress_callback, partial_callback)
+        if response.success and response.mode_used != "demo":
+            stored = replace(response)
+            with self._response_cache_lock:
+                self._response_cache.set(key, stored)
+            self._semantic_cache.store(request.semantic_text(), stored, vector, namespace)
+        return response
+
+    def _report(self, progress_callback: Optional[ProgressCallback], percent: int, message: str):
+        """Forward a milestone to the caller; UI errors never fail generation."""
+        if progress_callback is None:
+            return
+        try:
+            progress_callback(percent, message)
+        except Exception as e:
+            self.logger.debug(f"Progress callback failed: {e}")
+
+    def _stream_llm(
+        self,
+        prompt: str,
+        partial_callback: PartialCallback,
+        system_prompt: Optional[str] = None,
+    ) -> LLMResult:
+        """llm.generate() counterpart that streams, reporting accumulated text."""
+        parts: List[str] = []
+        last_emit = time.time()
+        chunks = (
+            self.llm.stream_generate(prompt, system_prompt=system_prompt)
+            if system_prompt else self.llm.stream_generate(prompt)
+        )
+        try:
+            # closing() frees the provider's concurrency slot even if we stop early
+            with closing(chunks):
+                for chunk in chunks:
+                    parts.append(chunk)
+                    if time.time() - last_emit >= PARTIAL_CALLBACK_INTERVAL:
+                        partial_callback("".join(parts))
+                        last_emit = time.time()
+        except Exception as e:
+            self.logger.error(f"❌ LLM stream failed: {e}")
+            return LLMResult(content="", tokens_used=0, success=False, error_message=str(e))
+
+        content = "".join(parts)
+        partial_callback(content)
+        return LLMResult(content=content, tokens_used=self.llm._estimate_tokens(prompt + content))
+
+    def _generate(
+        self,
+        request: PostRequest,
+        progress_callback: Optional[ProgressCallback] = None,
+        partial_callback: Optional[PartialCallback] = None,
+    ) -> PostResponse:
 
         start_time = datetime.now()
 
@@ -114,6 +273,7 @@ class LinkedInGenerator:
 
             # ---- ADVANCED MODE with LAZY RAG INIT ----
             if active_mode == GenerationMode.ADVANCED:
+                self._report(progress_callback, 10, "Retrieving context...")
                 # Lazy initialization - only load RAG when needed
                 if self._ensure_rag_initialized():
                     try:
@@ -130,6 +290,7 @@ class LinkedInGenerator:
             # fetch basic context so the post is about the actual repo.
             elif request.github_url:
                 self.logger.info("📝 Simple mode with GitHub URL — fetching repo context")
+                self._report(progress_callback, 10, "Fetching repository context...")
                 if self._ensure_rag_initialized():
                     try:
                         context = self.rag_engine.retrieve_context(request)
@@ -154,11 +315,16 @@ class LinkedInGenerator:
                 self.logger.info("✅ Using SIMPLE prompt (no context)")
 
             # ---- GENERATE ----
-            result = self.llm.generate(prompt)
+            self._report(progress_callback, 40, "Writing your post...")
+            if partial_callback is not None:
+                result = self._stream_llm(prompt, partial_callback)
+            else:
+                result = self.llm.generate(prompt)
 
             if not result.success or not result.content:
                 return self._generate_demo_response(request)
 
+            self._report(progress_callback, 90, "Formatting post and hashtags...")
             post, hashtags, caption = self._parse_llm_response(result.content)
 
             generation_time = (datetime.now() - start_time).total_seconds()
@@ -458,12 +624,14 @@ What’s your experience with {request.topic}?"""
     # HACKATHON POST GENERATION
     # ===============================
 
-    def generate_hackathon_post(self, request):
+    def generate_hackathon_post(self, request, partial_callback: Optional[PartialCallback] = None):
         """
         Generate a hackathon/competition post.
         
         Args:
             request: HackathonProjectRequest object
+            partial_callback: Optional callable receiving the post text so
+                far while the LLM streams it
             
         Returns:
             HackathonPostResponse with generated post
@@ -510,10 +678,11 @@ What’s your experience with {request.topic}?"""
             # Generate with LLM
             self.logger.info("🤖 Calling LLM for post generation...")
             
-            llm_result = self.llm.generate(
-                prompt=prompt,
-                system_prompt="You are an expert at writing compelling hackathon posts that inspire developers and tech communities. Your posts are authentic, specific, and emotionally resonant."
-            )
+            system_prompt = "You are an expert at writing compelling hackathon posts that inspire developers and tech communities. Your posts are authentic, specific, and emotionally resonant."
+            if partial_callback is not None:
+                llm_result = self._stream_llm(prompt, partial_callback, system_prompt=system_prompt)
+            else:
+                llm_result = self.llm.generate(prompt=prompt, system_prompt=system_prompt)
             
             if not llm_result.success:
                 self.logger.error(f"❌ LLM generation failed: {llm_result.error_message}")
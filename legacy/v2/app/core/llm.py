@@ -6,7 +6,8 @@ Clean abstraction for LLM interactions with fallbacks.
 
 import os
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Iterator, Optional
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, SystemMessage
 from .models import LLMResult, GenerationConfig
@@ -14,6 +15,12 @@ from .models import LLMResult, GenerationConfig
 
 logger = logging.getLogger(__name__)
 
+# In-flight LLM requests allowed per process, shared by every provider.
+# All calls hit one Groq endpoint, so bursts from concurrent sessions and
+# agent fan-out queue here instead of tripping the provider's rate limits.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+_llm_slots = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+
 
 class LLMProvider:
     """Unified LLM provider with error handling and fallbacks."""
@@ -42,6 +49,8 @@ class LLMProvider:
             api_key=self.api_key,
             temperature=self.config.temperature,
             max_tokens=self.config.max_tokens,
+            timeout=self.config.timeout_seconds,
+            max_retries=self.config.retry_attempts,
         )
         
         logger.info(f"✅ LLM Provider initialized: {self.config.model_name}")
@@ -50,7 +59,9 @@ class LLMProvider:
         self,
         prompt: str,
         system_prompt: str = "You are a professional LinkedIn content creator.",
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        max_tokens: Optional[int] = None
     ) -> LLMResult:
         """Generate content using LLM.
         
@@ -58,6 +69,8 @@ class LLMProvider:
             prompt: User prompt/content to generate from
             system_prompt: System context
             temperature: Override default temperature
+            timeout: Override the request timeout (seconds) from config
+            max_tokens: Override the completion cap from config
             
         Returns:
             LLMResult with generated content
@@ -70,7 +83,12 @@ class LLMProvider:
             ]
             
             # Call LLM
-            response = self.llm.invoke(messages)
+            llm = self._with_max_tokens(max_tokens)
+            with _llm_slots:
+                if timeout is not None:
+                    response = llm.invoke(messages, timeout=timeout)
+                else:
+                    response = llm.invoke(messages)
             
             # Extract content and token count
             content = response.content
@@ -96,6 +114,50 @@ class LLMProvider:
                 error_message=error_msg
             )
     
+    def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: str = "You are a professional LinkedIn content creator.",
+        timeout: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream generated content chunk by chunk.
+        
+        Args:
+            prompt: User prompt/content to generate from
+            system_prompt: System context
+            timeout: Override the request timeout (seconds) from config
+            max_tokens: Override the completion cap from config
+            
+        Yields:
+            Text chunks in generation order
+            
+        Raises:
+            Exception: If the LLM call fails (possibly after some chunks)
+        
+        The concurrency slot is held until the stream is exhausted or the
+        generator is closed; callers that may stop early must close() it.
+        """
+        messages = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=prompt),
+        ]
+        llm = self._with_max_tokens(max_tokens)
+        kwargs = {} if timeout is None else {"timeout": timeout}
+        _llm_slots.acquire()
+        try:
+            for chunk in llm.stream(messages, **kwargs):
+                if chunk.content:
+                    yield chunk.content
+        finally:
+            _llm_slots.release()
+    
+    def _with_max_tokens(self, max_tokens: Optional[int]):
+        """The chat model, bound to a different completion cap when one is given."""
+        if max_tokens is None or max_tokens == self.config.max_tokens:
+            return self.llm
+        return self.llm.bind(max_tokens=max_tokens)
+    
     @staticmethod
     def _estimate_tokens(text: str) -> int:
         """Rough token estimation (1 token ≈ 4 chars)."""
@@ -108,7 +170,8 @@ class LLMProvider:
             True if LLM is accessible
         """
         try:
-            result = self.llm.invoke([
+            # One completion token proves the round-trip; a full reply is wasted work
+            result = self._with_max_tokens(1).invoke([
                 HumanMessage(content="Test")
             ])
             return bool(result.content)
@@ -127,6 +190,31 @@ _default_provider: Optional[LLMProvider] = None
 # Deterministic provider with temperature=0 for consistent outputs
 _deterministic_provider: Optional[LLMProvider] = None
 
+# Guards first creation so concurrent callers share one provider (and its connections)
+_provider_lock = threading.Lock()
+
+
+def get_provider() -> LLMProvider:
+    """Get the shared default LLMProvider (standard temperature, 0.7).
+    
+    The generator, the agents it hands its provider to and get_llm()
+    all use this one instance, so they share a single Groq client.
+    
+    Returns:
+        LLMProvider with the default GenerationConfig
+    
+    Raises:
+        ValueError: If GROQ_API_KEY not set
+    
+    Lazy initialization - only creates on first call.
+    """
+    global _default_provider
+    if _default_provider is None:
+        with _provider_lock:
+            if _default_provider is None:
+                _default_provider = LLMProvider(GenerationConfig())
+    return _default_provider
+
 
 def get_llm() -> ChatGroq:
     """Get default LLM instance with standard temperature (0.7).
@@ -136,11 +224,7 @@ def get_llm() -> ChatGroq:
     
     Lazy initialization - only creates on first call.
     """
-    global _default_provider
-    if _default_provider is None:
-        config = GenerationConfig()
-        _default_provider = LLMProvider(config)
-    return _default_provider.llm
+    return get_provider().llm
 
 
 def get_llm_deterministic() -> ChatGroq:
@@ -156,6 +240,38 @@ def get_llm_deterministic() -> ChatGroq:
     """
     global _deterministic_provider
     if _deterministic_provider is None:
-        config = GenerationConfig(temperature=0)
-        _deterministic_provider = LLMProvider(config)
+        with _provider_lock:
+            if _deterministic_provider is None:
+                _deterministic_provider = LLMProvider(GenerationConfig(temperature=0))
     return _deterministic_provider.llm
+
+
+# Fast model for short, structured side outputs (scores, hook lists)
+INSTANT_MODEL = "llama-3.1-8b-instant"
+
+# Deterministic instant-tier providers, one per output cap
+_instant_providers: Dict[int, LLMProvider] = {}
+
+
+def get_llm_instant(max_tokens: int) -> ChatGroq:
+    """Get deterministic instant-tier LLM instance with a tight output cap.
+    
+    Used by auxiliary chains whose answers are short and fixed-format,
+    so generation stops early and identical inputs give identical outputs.
+    
+    Args:
+        max_tokens: Upper bound on completion tokens
+    
+    Returns:
+        ChatGroq instance on INSTANT_MODEL with temperature=0
+    """
+    provider = _instant_providers.get(max_tokens)
+    if provider is None:
+        with _provider_lock:
+            provider = _instant_providers.get(max_tokens)
+            if provider is None:
+                provider = LLMProvider(GenerationConfig(
+                    model_name=INSTANT_MODEL, temperature=0, max_tokens=max_tokens
+                ))
+                _instant_providers[max_tokens] = provider
+    return provider.llm
@@ -5,13 +5,22 @@ Complete data models for the LinkedIn content generator.
 All dataclasses are immutable and validated.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+import hashlib
+import json
 import re
 
 
+# Accepted GitHub source formats, compiled once at import
+_GITHUB_URL_PATTERNS = (
+    re.compile(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$'),
+    re.compile(r'^([^/]+)/([^/]+)/?$'),  # username/repo format
+)
+
+
 # ============================================================================
 # ENUMERATIONS - STRONGLY TYPED CHOICES
 # ============================================================================
@@ -110,14 +119,38 @@ class PostRequest:
     @staticmethod
     def _is_valid_github_url(url: str) -> bool:
         """Validate GitHub URL format."""
-        patterns = [
-            r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$',
-            r'^([^/]+)/([^/]+)/?$'  # username/repo format
-        ]
-        return any(re.search(pattern, url) for pattern in patterns)
+        return any(pattern.search(url) for pattern in _GITHUB_URL_PATTERNS)
 
+    # Fields that identify who/when, not what to generate
+    _CACHE_EXCLUDED = frozenset({"user_id", "session_id", "timestamp"})
 
-@dataclass
+    # Free-text fields a semantic cache may match approximately
+    _SEMANTIC_FIELDS = ("topic", "text_input", "user_key_message")
+
+    def _cache_payload(self, skip: frozenset) -> str:
+        payload = {}
+        for f in fields(self):
+            if f.name in skip:
+                continue
+            value = getattr(self, f.name)
+            payload[f.name] = value.value if isinstance(value, Enum) else value
+        return json.dumps(payload, sort_keys=True)
+
+    def cache_key(self) -> str:
+        """SHA-256 of the generation inputs; equal requests share a key."""
+        return hashlib.sha256(self._cache_payload(self._CACHE_EXCLUDED).encode()).hexdigest()
+
+    def cache_namespace(self) -> str:
+        """SHA-256 of every input except the free text; must match exactly for a semantic hit."""
+        skip = self._CACHE_EXCLUDED | frozenset(self._SEMANTIC_FIELDS)
+        return hashlib.sha256(self._cache_payload(skip).encode()).hexdigest()
+
+    def semantic_text(self) -> str:
+        """The free-text inputs, joined for embedding."""
+        return "\n".join(getattr(self, name) for name in self._SEMANTIC_FIELDS if getattr(self, name))
+
+
+@dataclass(slots=True)
 class PostResponse:
     """Response from post generation.
     
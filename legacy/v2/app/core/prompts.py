@@ -8,6 +8,16 @@ from typing import Optional
 from .models import PostRequest, ContentType, Tone, Audience
 
 
+# Specificity requirements applied at generation time, so the post comes
+# back concrete and the separate specificity rewrite is only a fallback
+SPECIFICITY_RULES = """SPECIFICITY CHECKLIST (apply while writing - there is no second editing pass):
+✓ Replace vague phrases with concrete, practical details ("it was great" → "the approach simplified our workflow")
+✓ At least 2 specific HOW-TO details, steps or principles readers can apply
+✓ Name the tools, techniques and outcomes involved instead of generic verbs
+✓ No generic filler lines
+✓ No invented statistics - specificity comes from detail, not fake data"""
+
+
 class PromptBuilder:
     """Build psychology-driven prompts for maximum engagement."""
     
@@ -245,6 +255,8 @@ ENGAGEMENT OPTIMIZATION:
 ✓ Line breaks matter (readability)
 ✓ Vulnerability gets 3x more comments
 
+{SPECIFICITY_RULES}
+
 NOW WRITE THE POST:
 - Follow the 5-section formula EXACTLY
 - Write like a human, not an AI
@@ -273,9 +285,10 @@ NOW WRITE THE POST:
             or (request.text_input[:120] + "…" if len(request.text_input) > 120 else request.text_input)
             or "your project"
         )
-        # Include full text_input if present (it IS the source material)
+        # Include full text_input if present (it IS the source material),
+        # unless the retrieved context already carries it verbatim
         text_input_block = ""
-        if getattr(request, "text_input", ""):
+        if getattr(request, "text_input", "") and request.text_input not in context:
             text_input_block = f"""
 USER-PROVIDED TEXT / CONTEXT:
 \"\"\"
@@ -418,6 +431,10 @@ AUTHENTICITY RULES:
 
 ---
 
+{SPECIFICITY_RULES}
+
+---
+
 NOW WRITE:
 
 Use specific details from the context.
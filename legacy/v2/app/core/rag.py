@@ -4,16 +4,77 @@ RAG Engine - Simplified Embedding + Retrieval
 Clean RAG implementation that replaces complex retrieval chains.
 """
 
+import hashlib
 import logging
+import os
+import threading
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 from .models import PostRequest, RepoContext, RAGContext
 from langchain_core.documents import Document
+from utils.cache import SimpleCache
  
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Vector stores keyed on a hash of their source documents, so regenerating
+# from the same input reuses the index instead of re-embedding it
+VECTOR_STORE_CACHE_SIZE = 8
+VECTOR_STORE_CACHE_TTL = 3600
+_VECTOR_STORE_CACHE = SimpleCache(VECTOR_STORE_CACHE_SIZE, VECTOR_STORE_CACHE_TTL)
+_SEARCH_CACHE = SimpleCache(max_size=128, default_ttl=VECTOR_STORE_CACHE_TTL)
+_VECTOR_STORE_CACHE_LOCK = threading.Lock()
+# One build lock per document hash: concurrent sessions asking for the same
+# store wait for the first build instead of embedding the documents again
+_VECTOR_STORE_BUILD_LOCKS: Dict[str, threading.Lock] = {}
+
+# Chunks per forward pass of the local embedding model
+EMBED_BATCH_SIZE = 64
+
+# On-disk chunk embeddings keyed by content hash, so a chunk seen in any
+# earlier run (same README, overlapping text input) is never re-encoded
+EMBED_CACHE_DIR = os.getenv("EMBED_CACHE_DIR", ".emb_cache")
+
+# Above this many chunks (e.g. a full-repo load) the index switches from
+# brute-force search to an HNSW graph
+HNSW_MIN_CHUNKS = 64
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+# Retrieved chunks sharing this much vocabulary with a kept chunk are dropped
+# (overlapping splitter windows repeat the same sentences)
+CHUNK_DUPLICATE_JACCARD = 0.7
+
+# Upper bound on the context handed to the prompt
+MAX_CONTEXT_CHARS = 4000
+
+
+def dedupe_chunks(documents: List[Document], threshold: float = CHUNK_DUPLICATE_JACCARD) -> List[Document]:
+    """Keep documents in rank order, dropping near-duplicates of ones already kept."""
+    kept: List[Document] = []
+    kept_words: List[set] = []
+    for doc in documents:
+        words = set(doc.page_content.lower().split())
+        if any(
+            len(words & other) / (len(words | other) or 1) >= threshold
+            for other in kept_words
+        ):
+            continue
+        kept.append(doc)
+        kept_words.append(words)
+    return kept
+
+
+def documents_hash(documents: List[Document]) -> str:
+    """Stable digest of the documents' text, used as the vector store cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for doc in documents:
+        digest.update(doc.page_content.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
 class RAGEngine:
     """
@@ -33,13 +94,16 @@ class RAGEngine:
     
     # Singleton embedding model - loads once, shared across instances
     _embedding_model = None
-    _embedding_lock = False
+    _embedding_lock = threading.Lock()
+    # _embedding_model behind the EMBED_CACHE_DIR store, built on first index
+    _document_embedder = None
     
     def __init__(self):
         """Initialize RAG engine with singleton embedding provider."""
         self.logger = logging.getLogger(__name__)
         self.embeddings = self._init_embeddings()
         self.vector_store = None
+        self._vector_store_key: Optional[str] = None
         
     def _init_embeddings(self):
         """Initialize embeddings with singleton pattern for production efficiency."""
@@ -49,18 +113,14 @@ class RAGEngine:
             self.logger.info("✅ Using cached embedding model")
             return RAGEngine._embedding_model
         
-        # Prevent concurrent initialization
-        if RAGEngine._embedding_lock:
-            self.logger.info("⏳ Waiting for embedding model to load...")
-            import time
-            for _ in range(30):  # Wait up to 30 seconds
-                time.sleep(1)
-                if RAGEngine._embedding_model is not None:
-                    return RAGEngine._embedding_model
-        
-        # Mark as loading
-        RAGEngine._embedding_lock = True
-        
+        # Concurrent callers block here until the first load finishes
+        with RAGEngine._embedding_lock:
+            if RAGEngine._embedding_model is not None:
+                return RAGEngine._embedding_model
+            return self._load_embeddings()
+
+    def _load_embeddings(self):
+        """Load the embedding model; caller holds _embedding_lock."""
         try:
             # Try HuggingFace embeddings first (free)
             from langchain_huggingface import HuggingFaceEmbeddings
@@ -68,7 +128,9 @@ class RAGEngine:
             self.logger.info("🔄 Loading embedding model (first time only)...")
             embeddings = HuggingFaceEmbeddings(
                 model_name="sentence-transformers/all-MiniLM-L6-v2",
-                model_kwargs={"device": "cpu"}
+                model_kwargs={"device": "cpu"},
+                # Chunks are encoded in batches; unit vectors let the index use inner product
+                encode_kwargs={"batch_size": EMBED_BATCH_SIZE, "normalize_embeddings": True},
             )
             
             # Cache for future use
@@ -96,9 +158,22 @@ class RAGEngine:
             # No embeddings available - will use simple text matching
             self.logger.warning("⚠️ No embeddings available - using simple text matching")
             return None
-            
-        finally:
-            RAGEngine._embedding_lock = False
+    
+    @classmethod
+    def warm_up(cls) -> None:
+        """Load the shared embedding model and run two throwaway encodes.
+
+        The first encodes of a fresh model are several times slower than
+        steady state; paying for them here keeps that off the first request.
+        """
+        try:
+            embeddings = cls().embeddings
+            if embeddings is None:
+                return
+            embeddings.embed_query("warmup")
+            embeddings.embed_query("warmup2")
+        except Exception as e:
+            logger.warning(f"Embedding warm-up failed: {e}")
     
     def retrieve_context(self, request: PostRequest) -> RAGContext:
         """
@@ -156,7 +231,7 @@ class RAGEngine:
                 context_parts.append(f"TECH STACK: {deps}")
                 sources_used.append("dependencies")
             
-            consolidated_context = "\n\n".join(context_parts)
+            consolidated_context = "\n\n".join(context_parts)[:MAX_CONTEXT_CHARS]
 
             # Calculate quality score
             quality_score = self._calculate_quality_score(repo_context)
@@ -273,15 +348,49 @@ class RAGEngine:
         return min(1.0, score)
     
     def create_vector_store(self, documents: List[Document]):
-        """Create vector store from documents (if embeddings available)."""
+        """Create vector store from documents (if embeddings available).
+
+        Stores are cached by document hash; the same documents are only
+        chunked and embedded once, even when requested concurrently.
+        """
         
         if not self.embeddings:
             self.logger.warning("No embeddings available - skipping vector store creation")
             return None
         
+        key = documents_hash(documents)
+        cached = self._use_cached_store(key)
+        if cached is not None:
+            return cached
+        
+        with _VECTOR_STORE_CACHE_LOCK:
+            build_lock = _VECTOR_STORE_BUILD_LOCKS.setdefault(key, threading.Lock())
+        try:
+            with build_lock:
+                # A concurrent caller may have finished the same build meanwhile
+                cached = self._use_cached_store(key)
+                if cached is not None:
+                    return cached
+                return self._build_vector_store(documents, key)
+        finally:
+            with _VECTOR_STORE_CACHE_LOCK:
+                _VECTOR_STORE_BUILD_LOCKS.pop(key, None)
+    
+    def _use_cached_store(self, key: str):
+        """Adopt the cached store for key, if any; returns it or None."""
+        with _VECTOR_STORE_CACHE_LOCK:
+            cached = _VECTOR_STORE_CACHE.get(key)
+        if cached is not None:
+            self.logger.info("✅ Using cached vector store")
+            self.vector_store, self._vector_store_key = cached, key
+        return cached
+    
+    def _build_vector_store(self, documents: List[Document], key: str):
+        """Chunk, embed and index documents, caching the store under key."""
         try:
             from langchain_text_splitters import RecursiveCharacterTextSplitter
             from langchain_community.vectorstores import FAISS
+            from langchain_community.vectorstores.utils import DistanceStrategy
             
             # Chunk documents
             splitter = RecursiveCharacterTextSplitter(
@@ -290,16 +399,89 @@ class RAGEngine:
             )
             chunks = splitter.split_documents(documents)
             
-            # Create vector store
-            self.vector_store = FAISS.from_documents(chunks, self.embeddings)
+            # Repeated boilerplate (licence headers, badges) splits into identical
+            # chunks — embed each distinct text once
+            seen = set()
+            chunks = [
+                chunk for chunk in chunks
+                if not (chunk.page_content in seen or seen.add(chunk.page_content))
+            ]
+            
+            # Inner-product index: on unit vectors that is cosine similarity directly
+            strategy = (
+                DistanceStrategy.MAX_INNER_PRODUCT if self._unit_embeddings()
+                else DistanceStrategy.EUCLIDEAN_DISTANCE
+            )
+            if len(chunks) > HNSW_MIN_CHUNKS:
+                self.vector_store = self._build_hnsw_store(FAISS, chunks, strategy)
+            else:
+                # One embed_documents call over every chunk (batched by the embedder)
+                self.vector_store = FAISS.from_documents(
+                    chunks, self._document_embeddings(), distance_strategy=strategy
+                )
+            self._vector_store_key = key
             self.logger.info(f"Created vector store with {len(chunks)} chunks")
             
+            with _VECTOR_STORE_CACHE_LOCK:
+                _VECTOR_STORE_CACHE.set(key, self.vector_store)
             return self.vector_store
             
         except Exception as e:
             self.logger.error(f"Vector store creation failed: {e}")
             return None
     
+    def _document_embeddings(self):
+        """Shared embedder for indexing, backed by the on-disk embedding cache."""
+        if RAGEngine._document_embedder is None:
+            with RAGEngine._embedding_lock:
+                if RAGEngine._document_embedder is None:
+                    RAGEngine._document_embedder = self._with_disk_cache(self.embeddings)
+        return RAGEngine._document_embedder
+    
+    def _with_disk_cache(self, embeddings):
+        """Wrap embeddings in CacheBackedEmbeddings; unwrapped if langchain's cache is unavailable."""
+        try:
+            from langchain.embeddings import CacheBackedEmbeddings
+            from langchain.storage import LocalFileStore
+        except ImportError:
+            self.logger.warning("Embedding cache unavailable - chunks will be re-embedded each build")
+            return embeddings
+        
+        # Separate namespaces per model and normalization, so vectors never mix
+        model = getattr(embeddings, "model_name", None) or getattr(embeddings, "model", type(embeddings).__name__)
+        namespace = f"{model}-{'unit' if self._unit_embeddings() else 'raw'}"
+        return CacheBackedEmbeddings.from_bytes_store(
+            embeddings, LocalFileStore(EMBED_CACHE_DIR), namespace=namespace
+        )
+    
+    def _build_hnsw_store(self, faiss_store_cls, chunks: List[Document], strategy):
+        """FAISS store over an HNSW graph index (approximate, sub-linear search)."""
+        import faiss
+        from langchain_community.docstore.in_memory import InMemoryDocstore
+        from langchain_community.vectorstores.utils import DistanceStrategy
+        
+        embeddings = self._document_embeddings()
+        texts = [chunk.page_content for chunk in chunks]
+        vectors = embeddings.embed_documents(texts)
+        metric = (
+            faiss.METRIC_INNER_PRODUCT if strategy == DistanceStrategy.MAX_INNER_PRODUCT
+            else faiss.METRIC_L2
+        )
+        index = faiss.IndexHNSWFlat(len(vectors[0]), HNSW_M, metric)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION  # must be set before adding
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+        
+        store = faiss_store_cls(
+            embeddings, index, InMemoryDocstore(), {}, distance_strategy=strategy
+        )
+        store.add_embeddings(zip(texts, vectors), metadatas=[chunk.metadata for chunk in chunks])
+        return store
+    
+    def _unit_embeddings(self) -> bool:
+        """True when the embedder returns L2-normalized vectors (documents and queries alike)."""
+        encode_kwargs = getattr(self.embeddings, "encode_kwargs", None) or {}
+        return bool(encode_kwargs.get("normalize_embeddings"))
+    
     def semantic_search(self, query: str, k: int = 5) -> List[Document]:
         """Perform semantic search if vector store available."""
         
@@ -307,12 +489,24 @@ class RAGEngine:
             self.logger.warning("No vector store available for semantic search")
             return []
         
+        # Only stores built by create_vector_store have a stable key to cache on
+        search_key = f"{self._vector_store_key}|{k}|{query}" if self._vector_store_key else None
+        if search_key:
+            with _VECTOR_STORE_CACHE_LOCK:
+                cached = _SEARCH_CACHE.get(search_key)
+            if cached is not None:
+                return list(cached)
+        
         try:
-            results = self.vector_store.similarity_search(query, k=k)
-            return results
+            results = dedupe_chunks(self.vector_store.similarity_search(query, k=k))
         except Exception as e:
             self.logger.error(f"Semantic search failed: {e}")
             return []
+        
+        if search_key:
+            with _VECTOR_STORE_CACHE_LOCK:
+                _SEARCH_CACHE.set(search_key, tuple(results))
+        return results
     
     def get_status(self) -> Dict[str, any]:
         """Get RAG engine status."""
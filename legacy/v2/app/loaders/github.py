@@ -8,11 +8,16 @@ import os
 import re
 import logging
 from typing import Optional, List, Dict, Any
+from utils.http import get_session
 from .base import BaseLoader
 
 
 logger = logging.getLogger(__name__)
 
+# Accepted repo references, tried in order: full/SSH URL, then "owner/repo"
+_GITHUB_URL_RE = re.compile(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$')
+_OWNER_REPO_RE = re.compile(r'^([^/]+)/([^/]+)/?$')
+
 
 class GitHubLoader(BaseLoader):
     """GitHub repository loader with fallback strategies."""
@@ -79,15 +84,15 @@ class GitHubLoader(BaseLoader):
     
     def _parse_github_url(self, url: str) -> tuple[Optional[str], Optional[str]]:
         """Parse GitHub URL to extract owner and repo."""
-        patterns = [
-            r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$',
-            r'^([^/]+)/([^/]+)/?$'  # username/repo format
-        ]
+        # Every accepted form has an owner/repo separator
+        if "/" not in url:
+            return None, None
         
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1), match.group(2)
+        match = _GITHUB_URL_RE.search(url) if "github.com" in url else None
+        if match is None:
+            match = _OWNER_REPO_RE.search(url)
+        if match:
+            return match.group(1), match.group(2)
         
         return None, None
     
@@ -143,11 +148,9 @@ class GitHubLoader(BaseLoader):
     def _load_with_public_api(self, owner: str, repo: str) -> Optional[str]:
         """Load using public GitHub API (no authentication)."""
         try:
-            import requests
-            
             # Get repository info
             repo_url = f"https://api.github.com/repos/{owner}/{repo}"
-            response = requests.get(repo_url, timeout=10)
+            response = get_session().get(repo_url, timeout=10)
             
             if response.status_code != 200:
                 logger.warning(f"GitHub API error: {response.status_code}")
@@ -157,7 +160,7 @@ class GitHubLoader(BaseLoader):
             
             # Get README
             readme_url = f"https://api.github.com/repos/{owner}/{repo}/readme"
-            readme_response = requests.get(readme_url, timeout=10)
+            readme_response = get_session().get(readme_url, timeout=10)
             
             readme_content = ""
             if readme_response.status_code == 200:
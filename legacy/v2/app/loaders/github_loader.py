@@ -3,10 +3,88 @@ GitHub Repository Loader for RAG Pipeline.
 Supports loading README files and repo metadata from GitHub.
 """
 
-import requests
+import copy
+import json
+import os
 import re
-from typing import List, Optional
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from langchain_core.documents import Document
+from utils.cache import SimpleCache
+from utils.http import get_session
+
+# Accepted repo references, tried in order: full/SSH URL, then "owner/repo"
+_GITHUB_URL_RE = re.compile(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$')
+_OWNER_REPO_RE = re.compile(r'^([^/]+)/([^/]+)$')
+
+# Loaded repo contexts per URL, so regenerating from the same repo skips
+# the GitHub round-trips (and their rate limit) for an hour
+REPO_CACHE_TTL = 3600
+_REPO_CACHE = SimpleCache(max_size=32, default_ttl=REPO_CACHE_TTL)
+_REPO_CACHE_LOCK = threading.Lock()
+
+# On-disk {url: (etag, body)} store for conditional requests; survives restarts
+# and st.cache_resource clears. A 304 costs no body bytes and no rate limit.
+GITHUB_ETAG_CACHE_PATH = os.getenv(
+    "GITHUB_ETAG_CACHE_PATH", os.path.expanduser("~/.lcs_cache.sqlite")
+)
+
+_etag_db = None
+_etag_db_lock = threading.Lock()
+
+
+def _get_etag_db() -> Optional[sqlite3.Connection]:
+    """Shared sqlite connection for the ETag store, or None if it can't be opened."""
+    global _etag_db
+    if _etag_db is None:
+        try:
+            db = sqlite3.connect(GITHUB_ETAG_CACHE_PATH, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS github_etags "
+                "(url TEXT PRIMARY KEY, etag TEXT NOT NULL, body TEXT NOT NULL, fetched_at REAL)"
+            )
+            db.commit()
+            _etag_db = db
+        except sqlite3.Error:
+            return None  # read-only home etc. - fetch unconditionally
+    return _etag_db
+
+
+def _conditional_get(url: str, headers: Dict[str, str]) -> Tuple[int, str]:
+    """
+    GET url with If-None-Match when an ETag is stored for it.
+    
+    Returns (status_code, body); a 304 is answered from the store as a 200.
+    """
+    with _etag_db_lock:
+        db = _get_etag_db()
+        row = db.execute(
+            "SELECT etag, body FROM github_etags WHERE url = ?", (url,)
+        ).fetchone() if db else None
+    
+    request_headers = dict(headers)
+    if row:
+        request_headers["If-None-Match"] = row[0]
+    response = get_session().get(url, headers=request_headers, timeout=10)
+    
+    if response.status_code == 304 and row:
+        return 200, row[1]
+    
+    etag = response.headers.get("ETag")
+    if response.status_code == 200 and etag and db:
+        with _etag_db_lock:
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO github_etags VALUES (?, ?, ?, ?)",
+                    (url, etag, response.text, time.time()),
+                )
+                db.commit()
+            except sqlite3.Error:
+                pass
+    return response.status_code, response.text
 
 
 class GitHubLoader:
@@ -43,16 +121,12 @@ class GitHubLoader:
         url = url.rstrip('/')
         
         # Handle various GitHub URL formats
-        patterns = [
-            r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$',
-            r'^([^/]+)/([^/]+)$'  # owner/repo format
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                owner, repo = match.groups()
-                return owner.strip(), repo.strip()
+        match = _GITHUB_URL_RE.search(url) if "github.com" in url else None
+        if match is None:
+            match = _OWNER_REPO_RE.search(url)
+        if match:
+            owner, repo = match.groups()
+            return owner.strip(), repo.strip()
         
         raise ValueError(f"Invalid GitHub URL: {url}")
     
@@ -78,18 +152,18 @@ class GitHubLoader:
             
             for readme_name in readme_names:
                 url = f"{self.raw_url}/{owner}/{repo}/main/{readme_name}"
-                response = requests.get(url, headers=self.headers, timeout=10)
+                status, body = _conditional_get(url, self.headers)
                 
-                if response.status_code == 200:
-                    readme_content = response.text
+                if status == 200:
+                    readme_content = body
                     break
                 
                 # Try master branch if main fails
                 if readme_name == readme_names[0]:
                     url = f"{self.raw_url}/{owner}/{repo}/master/{readme_name}"
-                    response = requests.get(url, headers=self.headers, timeout=10)
-                    if response.status_code == 200:
-                        readme_content = response.text
+                    status, body = _conditional_get(url, self.headers)
+                    if status == 200:
+                        readme_content = body
                         break
             
             if not readme_content:
@@ -125,10 +199,11 @@ class GitHubLoader:
             
             # Get repository info from GitHub API
             api_url = f"{self.base_url}/repos/{owner}/{repo}"
-            response = requests.get(api_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            status, body = _conditional_get(api_url, self.headers)
+            if status != 200:
+                raise Exception(f"GitHub API returned HTTP {status} for {api_url}")
             
-            repo_data = response.json()
+            repo_data = json.loads(body)
             
             # Extract relevant information
             info_text = f"""
@@ -173,10 +248,11 @@ Forks: {repo_data.get('forks_count', 0)}
             owner, repo = self.parse_github_url(repo_url)
             
             api_url = f"{self.base_url}/repos/{owner}/{repo}/contents"
-            response = requests.get(api_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            status, body = _conditional_get(api_url, self.headers)
+            if status != 200:
+                raise Exception(f"GitHub API returned HTTP {status} for {api_url}")
             
-            files_data = response.json()
+            files_data = json.loads(body)
             
             # Extract file information
             files_text = "Repository Files:\n"
@@ -208,29 +284,41 @@ Forks: {repo_data.get('forks_count', 0)}
         """
         documents = []
         
-        # Load README
-        try:
-            documents.extend(self.load_readme(repo_url))
-        except Exception as e:
-            print(f"Warning: Could not load README - {str(e)}")
-        
-        # Load repo metadata
-        try:
-            documents.extend(self.load_repo_info(repo_url))
-        except Exception as e:
-            print(f"Warning: Could not load repo info - {str(e)}")
-        
-        # Load files list
-        try:
-            documents.extend(self.load_files_list(repo_url))
-        except Exception as e:
-            print(f"Warning: Could not load files list - {str(e)}")
+        for label, result in self._load_sources(repo_url).items():
+            if isinstance(result, Exception):
+                print(f"Warning: Could not load {label} - {str(result)}")
+            else:
+                documents.extend(result)
         
         if not documents:
             raise Exception(f"Failed to load any content from {repo_url}")
         
         return documents
     
+    def _load_sources(self, repo_url: str) -> Dict[str, object]:
+        """
+        Fetch README, repo info and files list concurrently.
+        
+        The three GitHub calls are independent, so a cold load costs the
+        slowest round-trip rather than their sum. Returns each source's
+        documents (or the exception it raised), keyed in fallback order.
+        """
+        loaders = {
+            "README": self.load_readme,
+            "repo info": self.load_repo_info,
+            "files list": self.load_files_list,
+        }
+        with ThreadPoolExecutor(max_workers=len(loaders)) as pool:
+            futures = {label: pool.submit(load, repo_url) for label, load in loaders.items()}
+        
+        results = {}
+        for label, future in futures.items():
+            try:
+                results[label] = future.result()
+            except Exception as e:
+                results[label] = e
+        return results
+    
     def load_with_fallback(self, repo_url: str = None):
         """
         Production-safe GitHub loading with comprehensive fallback strategy.
@@ -244,14 +332,39 @@ Forks: {repo_data.get('forks_count', 0)}
             
         Returns:
             RepoContext object with all available information
+            (successful loads are cached per URL for REPO_CACHE_TTL seconds)
         """
-        from core.models import RepoContext
-        
         # Use provided URL or fall back to initialized URL
         url = repo_url or getattr(self, 'repo_url', None)
         if not url:
             return self._fallback_empty("No repository URL provided")
         
+        # Key on owner/repo so every spelling of the same repo (https://, .git,
+        # bare "owner/repo") shares one entry
+        try:
+            owner, repo = self.parse_github_url(url.strip())
+            cache_key = f"{owner}/{repo}".lower()
+        except ValueError:
+            cache_key = url.strip().rstrip('/').lower()
+        with _REPO_CACHE_LOCK:
+            cached = _REPO_CACHE.get(cache_key)
+        # Callers get their own lists (sources_used ends up in PostResponse),
+        # so no in-place edit downstream can change the cached entry
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        context = self._load_repo_context(url)
+        # Fallbacks may be transient (rate limit, network) - only keep real loads
+        if not context.fallback_used:
+            with _REPO_CACHE_LOCK:
+                _REPO_CACHE.set(cache_key, context)
+            context = copy.deepcopy(context)
+        return context
+    
+    def _load_repo_context(self, url: str) -> 'RepoContext':
+        """Fetch README, metadata and file list for load_with_fallback (uncached)."""
+        from core.models import RepoContext
+        
         try:
             owner, repo = self.parse_github_url(url)
             repo_name = f"{owner}/{repo}"
@@ -262,37 +375,30 @@ Forks: {repo_data.get('forks_count', 0)}
                 fallback_used=False
             )
             
+            sources = self._load_sources(url)
+            
             # Try 1: Load README
-            try:
-                readme_docs = self.load_readme(url)
-                if readme_docs:
-                    context.readme_content = readme_docs[0].page_content
-                    context.readme_found = True
-                    context.sources_used.append("readme")
-            except Exception:
-                pass  # Silent fail, continue to next source
+            readme_docs = sources["README"]
+            if readme_docs and not isinstance(readme_docs, Exception):
+                context.readme_content = readme_docs[0].page_content
+                context.readme_found = True
+                context.sources_used.append("readme")
             
             # Try 2: Load repo metadata
-            try:
-                info_docs = self.load_repo_info(url)
-                if info_docs:
-                    metadata = info_docs[0].metadata
-                    context.description = info_docs[0].page_content.split('Description:')[1].split('\n')[0].strip() if 'Description:' in info_docs[0].page_content else ""
-                    context.language = metadata.get('language', '')
-                    context.stars = metadata.get('stars', 0)
-                    context.sources_used.append("metadata")
-            except Exception:
-                pass
+            info_docs = sources["repo info"]
+            if info_docs and not isinstance(info_docs, Exception):
+                metadata = info_docs[0].metadata
+                context.description = info_docs[0].page_content.split('Description:')[1].split('\n')[0].strip() if 'Description:' in info_docs[0].page_content else ""
+                context.language = metadata.get('language', '')
+                context.stars = metadata.get('stars', 0)
+                context.sources_used.append("metadata")
             
             # Try 3: Load file structure
-            try:
-                files_docs = self.load_files_list(url)
-                if files_docs:
-                    files_content = files_docs[0].page_content
-                    context.file_structure = [line.strip() for line in files_content.split('\n') if line.strip() and line.strip() != 'Repository Files:']
-                    context.sources_used.append("file_structure")
-            except Exception:
-                pass
+            files_docs = sources["files list"]
+            if files_docs and not isinstance(files_docs, Exception):
+                files_content = files_docs[0].page_content
+                context.file_structure = [line.strip() for line in files_content.split('\n') if line.strip() and line.strip() != 'Repository Files:']
+                context.sources_used.append("file_structure")
             
             # Calculate quality score
             if context.readme_found:
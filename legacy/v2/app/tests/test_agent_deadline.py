@@ -0,0 +1,64 @@
+"""
+tests/test_agent_deadline.py
+Test that agent LLM calls are bounded by the agent's remaining time budget
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.base_agent import AGENT_DEADLINE, AgentResult, BaseAgent
+from core.models import GenerationConfig, LLMResult
+from tools.llm_cache import get_llm_response_cache
+
+
+class RecordingProvider:
+    """Stands in for LLMProvider: records the timeout of each call."""
+
+    def __init__(self):
+        self.config = GenerationConfig()
+        self.timeouts = []
+
+    def generate(self, prompt, system_prompt="", timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        return LLMResult(content="answer")
+
+
+class EchoAgent(BaseAgent):
+    def run(self, input_data):
+        return AgentResult(success=True, agent_name=self.name)
+
+
+def test_unbounded_run_passes_no_timeout():
+    get_llm_response_cache().clear()
+    provider = RecordingProvider()
+
+    EchoAgent("Echo", provider).think("Question")
+
+    assert provider.timeouts == [None]
+
+
+def test_remaining_budget_becomes_request_timeout():
+    get_llm_response_cache().clear()
+    provider = RecordingProvider()
+    token = AGENT_DEADLINE.set(time.time() + 30)
+    try:
+        EchoAgent("Echo", provider).think("Question")
+    finally:
+        AGENT_DEADLINE.reset(token)
+
+    assert 0 < provider.timeouts[0] <= 30
+
+
+def test_spent_budget_skips_llm_call():
+    get_llm_response_cache().clear()
+    provider = RecordingProvider()
+    token = AGENT_DEADLINE.set(time.time() - 1)
+    try:
+        response = EchoAgent("Echo", provider).think("Question")
+    finally:
+        AGENT_DEADLINE.reset(token)
+
+    assert response == ""
+    assert provider.timeouts == []
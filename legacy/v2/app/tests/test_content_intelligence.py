@@ -0,0 +1,81 @@
+"""
+tests/test_content_intelligence.py
+Test the strategy call that also drafts the three post variants
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.content_intelligence_agent import ContentIntelligenceAgent, STRATEGY_MAX_TOKENS
+from core.models import GenerationConfig, LLMResult
+from tools.llm_cache import get_llm_response_cache
+
+
+STRATEGY_LINES = (
+    "KEY_MESSAGE: Ship small\n"
+    "TARGET_AUDIENCE: engineers\n"
+    "EMOTIONAL_HOOK: relief\n"
+    "ANGLE_1_STORYTELLER: a\n"
+    "ANGLE_2_STRATEGIST: b\n"
+    "ANGLE_3_PROVOCATEUR: c\n"
+    "CONTENT_PILLARS: speed, quality, focus\n"
+    "CALL_TO_ACTION: Tell me yours\n"
+)
+
+
+class RecordingProvider:
+    """Stands in for LLMProvider: returns a fixed reply and records call kwargs."""
+
+    def __init__(self, reply: str):
+        self.config = GenerationConfig()
+        self.reply = reply
+        self.calls = []
+
+    def generate(self, prompt, system_prompt="", **kwargs):
+        self.calls.append(kwargs)
+        return LLMResult(content=self.reply)
+
+
+def test_strategy_call_raises_completion_cap():
+    """Strategy + three drafts need more than the default 1000-token cap."""
+    get_llm_response_cache().clear()
+    provider = RecordingProvider(STRATEGY_LINES)
+    agent = ContentIntelligenceAgent(provider)
+
+    result = agent.run({"synthesis": "Shipping small changes daily"})
+
+    assert result.success
+    assert provider.calls[0]["max_tokens"] == STRATEGY_MAX_TOKENS
+    assert STRATEGY_MAX_TOKENS > provider.config.max_tokens
+
+
+def test_truncated_drafts_block_keeps_strategy():
+    """A reply cut off inside the JSON block yields no drafts but a full strategy."""
+    get_llm_response_cache().clear()
+    truncated = STRATEGY_LINES + '```json\n{"storyteller": "Day one of shipping small'
+    agent = ContentIntelligenceAgent(RecordingProvider(truncated))
+
+    result = agent.run({"synthesis": "Shipping small changes weekly"})
+
+    assert result.success
+    assert result.output["drafts"] == {}
+    assert result.output["strategy"]["key_message"] == "Ship small"
+    assert result.output["angles"]["storyteller"] == "a"
+
+
+def test_complete_drafts_block_is_parsed():
+    get_llm_response_cache().clear()
+    reply = (
+        STRATEGY_LINES
+        + '```json\n{"storyteller": "Post one?", "strategist": "Post two?", "provocateur": "Post three?"}\n```'
+    )
+    agent = ContentIntelligenceAgent(RecordingProvider(reply))
+
+    result = agent.run({"synthesis": "Shipping small changes monthly"})
+
+    assert result.output["drafts"] == {
+        "storyteller": "Post one?",
+        "strategist": "Post two?",
+        "provocateur": "Post three?",
+    }
@@ -0,0 +1,95 @@
+"""
+tests/test_llm_cache.py
+Test the shared agent LLM response cache
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The provider only needs a key to build its client; no request is sent
+os.environ.setdefault("GROQ_API_KEY", "test-key")
+
+from agents.base_agent import AgentResult, BaseAgent
+from agents.generation_agent import GenerationAgent
+from core.llm import LLMProvider, get_provider
+from core.models import GenerationConfig, LLMResult
+from tools.llm_cache import get_llm_response_cache
+
+
+class EchoAgent(BaseAgent):
+    """Minimal agent: run() is not exercised, only think()."""
+
+    def run(self, input_data):
+        return AgentResult(success=True, agent_name=self.name)
+
+
+def _counting_provider(monkeypatch, provider=None):
+    """provider (default: the real default provider) with generate() replaced by a call counter."""
+    provider = provider or get_provider()
+    calls = []
+
+    def fake_generate(prompt, system_prompt="", **kwargs):
+        calls.append(prompt)
+        return LLMResult(content=f"answer {len(calls)}")
+
+    monkeypatch.setattr(provider, "generate", fake_generate)
+    return provider, calls
+
+
+def _deterministic_provider():
+    return LLMProvider(GenerationConfig(temperature=0))
+
+
+VARIANT_ARGS = dict(
+    variant_type="storyteller",
+    angle="A personal story about shipping small",
+    content="Shipping small changes daily",
+    strategy={"key_message": "Ship small"},
+    tone="professional",
+    audience="engineers",
+    hashtags="",
+)
+
+
+def test_sampled_variant_calls_llm_every_time(monkeypatch):
+    """At the default (non-zero) temperature every variant is freshly generated."""
+    get_llm_response_cache().clear()
+    provider, calls = _counting_provider(monkeypatch)
+    assert provider.config.temperature != 0
+
+    agent = GenerationAgent(provider)
+    first = agent._generate_variant(**VARIANT_ARGS)
+    second = agent._generate_variant(**VARIANT_ARGS)
+
+    assert (first, second) == ("answer 1", "answer 2")
+    assert len(calls) == 2
+    assert agent.metadata["llm_cache_hits"] == 0
+
+
+def test_deterministic_variant_hits_cache(monkeypatch):
+    """A repeated temperature-0 call is served from the cache."""
+    get_llm_response_cache().clear()
+    provider, calls = _counting_provider(monkeypatch, _deterministic_provider())
+
+    agent = GenerationAgent(provider)
+    first = agent._generate_variant(**VARIANT_ARGS)
+    second = agent._generate_variant(**VARIANT_ARGS)
+
+    assert first == second == "answer 1"
+    assert len(calls) == 1
+    assert agent.metadata["llm_cache_hits"] == 1
+
+
+def test_different_prompt_misses_cache(monkeypatch):
+    """Only identical prompts share an entry."""
+    get_llm_response_cache().clear()
+    provider, calls = _counting_provider(monkeypatch, _deterministic_provider())
+
+    agent = EchoAgent("Echo", provider)
+    agent.think("First question")
+    agent.think("Second question")
+
+    assert len(calls) == 2
+    assert agent.metadata["llm_cache_hits"] == 0
+    assert agent.metadata["llm_cache_misses"] == 2
@@ -0,0 +1,56 @@
+"""
+tests/test_llm_stream.py
+Test that streaming releases the shared LLM concurrency slot
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The provider only needs a key to build its client; no request is sent
+os.environ.setdefault("GROQ_API_KEY", "test-key")
+
+from types import SimpleNamespace
+
+from core import llm as llm_module
+from core.llm import LLMProvider
+
+
+class FakeChat:
+    """Stands in for ChatGroq: streams a fixed list of chunks."""
+
+    def stream(self, messages):
+        for text in ("one ", "two ", "three"):
+            yield SimpleNamespace(content=text)
+
+
+def _free_slots():
+    return llm_module._llm_slots._value
+
+
+def _provider():
+    provider = LLMProvider()
+    provider.llm = FakeChat()
+    return provider
+
+
+def test_exhausted_stream_releases_slot():
+    before = _free_slots()
+
+    chunks = list(_provider().stream_generate("Write a post"))
+
+    assert chunks == ["one ", "two ", "three"]
+    assert _free_slots() == before
+
+
+def test_closed_stream_releases_slot():
+    """A caller that stops early and closes the generator gives the slot back."""
+    before = _free_slots()
+
+    stream = _provider().stream_generate("Write a post")
+    assert next(stream) == "one "
+    assert _free_slots() == before - 1
+
+    stream.close()
+
+    assert _free_slots() == before
@@ -4,14 +4,35 @@ Agentic AI Tools Package
 7 specialized tools that agents use to analyze and generate content.
 """
 
-from tools.vision_analyzer import VisionAnalyzer
-from tools.document_processor import DocumentProcessor
-from tools.web_scraper import WebScraper
-from tools.trend_analyzer import TrendAnalyzer
-from tools.sentiment_analyzer import SentimentAnalyzer
-from tools.engagement_predictor import EngagementPredictor
-from tools.brand_analyzer import BrandAnalyzer
-from tools.linkedin_poster import LinkedInPoster, get_linkedin_posting_tools
+import importlib
+
+# Exported name -> defining module. Submodules load on first attribute
+# access, so importing one tool (e.g. tools.semantic_cache from core) does
+# not pull in the other nine.
+_EXPORTS = {
+    "VisionAnalyzer": "tools.vision_analyzer",
+    "DocumentProcessor": "tools.document_processor",
+    "WebScraper": "tools.web_scraper",
+    "TrendAnalyzer": "tools.trend_analyzer",
+    "SentimentAnalyzer": "tools.sentiment_analyzer",
+    "EngagementPredictor": "tools.engagement_predictor",
+    "BrandAnalyzer": "tools.brand_analyzer",
+    "LLMResponseCache": "tools.llm_cache",
+    "get_llm_response_cache": "tools.llm_cache",
+    "SemanticCache": "tools.semantic_cache",
+    "LinkedInPoster": "tools.linkedin_poster",
+    "get_linkedin_posting_tools": "tools.linkedin_poster",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "VisionAnalyzer",
@@ -21,6 +42,9 @@ __all__ = [
     "SentimentAnalyzer",
     "EngagementPredictor",
     "BrandAnalyzer",
+    "LLMResponseCache",
+    "get_llm_response_cache",
+    "SemanticCache",
     "LinkedInPoster",
     "get_linkedin_posting_tools",
 ]
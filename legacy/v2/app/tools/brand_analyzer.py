@@ -73,6 +73,7 @@ class BrandAnalyzer:
                 profile = self._llm_analyze(posts)
             else:
                 profile = self._heuristic_analyze(posts)
+            self._ensure_voice_summary(profile)
             self._cache_profile(profile)
             return profile
         except Exception as exc:
@@ -102,12 +103,24 @@ class BrandAnalyzer:
         try:
             data = json.loads(self.profile_path.read_text())
             profile = BrandProfile(success=True, **data)
+            self._ensure_voice_summary(profile)
             self._cached_profile = profile
             return profile
         except Exception as exc:
             logger.warning(f"⚠️ Could not load brand profile: {exc}")
             return None
 
+    @staticmethod
+    def _ensure_voice_summary(profile: BrandProfile):
+        """Always populate brand_voice_summary so consumers can use it directly."""
+        if not profile.brand_voice_summary:
+            profile.brand_voice_summary = (
+                f"Tone: {profile.dominant_tone}. "
+                f"Uses emojis: {profile.uses_emojis}. "
+                f"Storytelling: {profile.uses_storytelling}. "
+                f"Lists: {profile.uses_lists}."
+            )
+
     # ------------------------------------------------------------------
     # LLM ANALYSIS
     # ------------------------------------------------------------------
@@ -141,10 +154,11 @@ BRAND_VOICE_SUMMARY: [2-3 sentence overall brand voice description]"""
 
     def _parse_llm_profile(self, raw: str) -> BrandProfile:
         data: Dict = {}
-        for line in raw.strip().split("\n"):
-            if ":" in line:
-                k, _, v = line.partition(":")
-                data[k.strip().upper()] = v.strip()
+        for line in raw.splitlines():
+            sep = line.find(":")
+            if sep < 0:
+                continue
+            data[line[:sep].strip().upper()] = line[sep + 1:].strip()
 
         def g(k, d=""):
             return data.get(k, d)
@@ -186,10 +200,11 @@ SUGGESTIONS: [pipe-separated improvement suggestions]"""
             return self._heuristic_check(post, profile)
 
         data: Dict = {}
-        for line in result.content.strip().split("\n"):
-            if ":" in line:
-                k, _, v = line.partition(":")
-                data[k.strip().upper()] = v.strip()
+        for line in result.content.splitlines():
+            sep = line.find(":")
+            if sep < 0:
+                continue
+            data[line[:sep].strip().upper()] = line[sep + 1:].strip()
 
         score = self._safe_float(data.get("SCORE", "0.7"))
         return ConsistencyCheckResult(
@@ -210,7 +225,7 @@ SUGGESTIONS: [pipe-separated improvement suggestions]"""
         words = all_text.split()
         avg_len = sum(len(p.split()) for p in posts) // max(1, len(posts))
 
-        emoji_count = sum(1 for p in posts if any(ord(c) > 127 for c in p))
+        emoji_count = sum(1 for p in posts if not p.isascii())  # str.isascii scans in C
         uses_emojis = emoji_count > len(posts) * 0.4
 
         question_count = sum(1 for p in posts if "?" in p)
@@ -244,7 +259,7 @@ SUGGESTIONS: [pipe-separated improvement suggestions]"""
         deviations = []
         suggestions = []
 
-        has_emojis = any(ord(c) > 127 for c in post)
+        has_emojis = not post.isascii()
         if has_emojis == profile.uses_emojis:
             score += 0.1
             aligned.append("Emoji usage matches brand style")
@@ -117,10 +117,11 @@ OPTIMIZATION_TIPS: [pipe-separated tips]"""
 
     def _parse_llm_prediction(self, raw: str) -> EngagementPrediction:
         data: Dict = {}
-        for line in raw.strip().split("\n"):
-            if ":" in line:
-                key, _, val = line.partition(":")
-                data[key.strip().upper()] = val.strip()
+        for line in raw.splitlines():
+            sep = line.find(":")
+            if sep < 0:
+                continue
+            data[line[:sep].strip().upper()] = line[sep + 1:].strip()
 
         def get(k, default=""):
             return data.get(k, default)
@@ -0,0 +1,92 @@
+"""
+LLM Response Cache Tool
+=======================
+Exact-match prompt -> response cache shared by every agent and tool.
+Keys cover the normalized prompt, system prompt, model, temperature and
+completion cap; only deterministic calls (temperature 0) are cached, since
+replaying a sampled response would make "generate again" return the same post.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from utils.cache import LLMCache, SimpleCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A stored LLM response plus what is needed to invalidate it."""
+    content: str
+    model: str
+    created_at: float
+
+
+class LLMResponseCache:
+    """Thread-safe exact-match cache in front of LLMProvider calls."""
+
+    def __init__(self, cache: Optional[SimpleCache] = None):
+        self._cache = cache or LLMCache()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        prompt: str, system_prompt: str, model: str, temperature: float, max_tokens: Optional[int] = None
+    ) -> str:
+        payload = {"p": prompt.strip(), "s": system_prompt, "m": model, "t": temperature, "n": max_tokens}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def key_for(
+        self, llm, prompt: str, system_prompt: str, max_tokens: Optional[int] = None
+    ) -> Optional[str]:
+        """Cache key for a call on llm, or None when sampling is not deterministic."""
+        config = getattr(llm, "config", None)
+        temperature = getattr(config, "temperature", None)
+        if temperature != 0:
+            return None
+        return self.make_key(
+            prompt,
+            system_prompt,
+            getattr(config, "model_name", ""),
+            temperature,
+            max_tokens or getattr(config, "max_tokens", None),
+        )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, key: str, content: str, model: str = ""):
+        with self._lock:
+            self._cache.set(key, CachedResponse(content=content, model=model, created_at=time.time()))
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, **self._cache.get_stats()}
+
+
+# Process-wide instance so repeated workflows share hits
+_response_cache = LLMResponseCache()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Return the shared LLM response cache."""
+    return _response_cache
@@ -0,0 +1,100 @@
+"""
+Semantic Cache Tool
+===================
+Embedding-based cache: a lookup hits when a previously stored key is
+close enough in meaning (cosine similarity >= threshold), so "AI tools"
+and "AI tooling" share one entry.
+
+Uses the sentence-transformers model RAGEngine already keeps as a
+singleton. The cache never loads that model itself — until something
+else has loaded it, lookups simply miss and nothing is stored.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _shared_embed_fn() -> Optional[Callable[[str], List[float]]]:
+    """embed_query of the already-loaded RAG embedding model, if any."""
+    try:
+        from core.rag import RAGEngine
+    except Exception:
+        return None
+    model = RAGEngine._embedding_model
+    return model.embed_query if model is not None else None
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """Thread-safe nearest-neighbour cache over normalized embeddings."""
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 256,
+        ttl: int = 7200,
+        embed_fn: Optional[Callable[[str], List[float]]] = None,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._embed_fn = embed_fn
+        # (unit vector, value, stored_at, namespace)
+        self._entries: List[Tuple[List[float], Any, float, str]] = []
+        self._lock = threading.Lock()
+
+    def _embed(self, text: str) -> Optional[List[float]]:
+        embed_fn = self._embed_fn or _shared_embed_fn()
+        if embed_fn is None or not text.strip():
+            return None
+        try:
+            return _normalize(embed_fn(text))
+        except Exception as exc:
+            logger.warning(f"⚠️ Semantic cache embedding failed: {exc}")
+            return None
+
+    def lookup(self, text: str, namespace: str = "") -> Tuple[Optional[Any], Optional[List[float]]]:
+        """
+        Return (value, embedding). value is None on a miss; pass the
+        embedding back to store() to avoid embedding the text twice.
+        Only entries stored under the same namespace can match.
+        """
+        vector = self._embed(text)
+        if vector is None:
+            return None, None
+
+        now = time.time()
+        best_value, best_sim = None, self.threshold
+        with self._lock:
+            self._entries = [e for e in self._entries if now - e[2] < self.ttl]
+            for stored, value, _, entry_namespace in self._entries:
+                if entry_namespace != namespace:
+                    continue
+                sim = sum(a * b for a, b in zip(vector, stored))
+                if sim >= best_sim:
+                    best_value, best_sim = value, sim
+        if best_value is not None:
+            logger.debug(f"🎯 Semantic cache hit (similarity {best_sim:.3f})")
+        return best_value, vector
+
+    def store(self, text: str, value: Any, vector: Optional[List[float]] = None, namespace: str = ""):
+        vector = vector or self._embed(text)
+        if vector is None:
+            return
+        with self._lock:
+            self._entries.append((vector, value, time.time(), namespace))
+            if len(self._entries) > self.max_entries:
+                self._entries.pop(0)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
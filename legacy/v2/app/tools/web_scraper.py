@@ -10,8 +10,17 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from urllib.parse import urlparse
 
+from utils.http import get_session
+
 logger = logging.getLogger(__name__)
 
+REQUEST_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 Chrome/120.0 Safari/537.36"
+    )
+}
+
 
 @dataclass
 class WebScrapingResult:
@@ -65,9 +74,6 @@ class WebScraper:
             logger.error(f"❌ Scraping failed for {url}: {exc}")
             return WebScrapingResult(success=False, url=url, error_message=str(exc))
 
-    def scrape_multiple(self, urls: List[str]) -> List[WebScrapingResult]:
-        return [self.scrape(u) for u in urls]
-
     # ------------------------------------------------------------------
     # INTERNALS
     # ------------------------------------------------------------------
@@ -80,17 +86,9 @@ class WebScraper:
             return False
 
     def _fetch(self, url: str):
-        """Fetch HTML using requests + basic headers."""
+        """Fetch HTML over the shared keep-alive session."""
         try:
-            import requests  # type: ignore
-
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 Chrome/120.0 Safari/537.36"
-                )
-            }
-            resp = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+            resp = get_session().get(url, headers=REQUEST_HEADERS, timeout=10, allow_redirects=True)
             if resp.status_code == 200:
                 return resp.text, resp.url
             return None, url
@@ -6,6 +6,8 @@ with bold borders, gradient cards, mode-coloured presentation,
 and LinkedIn publishing options.
 """
 
+import html
+
 import streamlit as st
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -54,6 +56,8 @@ def update_agent_status(placeholders: Dict, status: WorkflowStatus):
         return
     icon, label, desc = AGENT_INFO[key]
     display_msg = status.message or desc
+    if status.partial_content:
+        display_msg = f"{display_msg} — …{html.escape(status.partial_content[-120:])}"
     placeholders[key].markdown(
         _agent_card(icon, label, display_msg, status.status),
         unsafe_allow_html=True,
@@ -13,6 +13,13 @@ from core.models import (
 )
 from ui.styles import _get_theme, get_mode_color, render_section_header
 
+# Selectbox label -> enum, built once at import (dict order = option order)
+_CONTENT_TYPE_BY_LABEL = {label: ContentType(value) for value, label in get_content_types().items()}
+_TONE_BY_LABEL = {label: Tone(value) for value, label in get_tones().items()}
+_AUDIENCE_BY_LABEL = {label: Audience(value) for value, label in get_audiences().items()}
+_CONTENT_TYPE_LABELS = tuple(_CONTENT_TYPE_BY_LABEL)
+_TONE_LABELS = tuple(_TONE_BY_LABEL)
+_AUDIENCE_LABELS = tuple(_AUDIENCE_BY_LABEL)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN UI COMPONENTS
@@ -88,19 +95,14 @@ class UIComponents:
         """Render content type selector."""
         render_section_header("Content Type", "📝")
 
-        content_types = get_content_types()
         selected_display = st.selectbox(
             "Choose your content style:",
-            options=list(content_types.values()),
+            options=_CONTENT_TYPE_LABELS,
             index=0,
             help="Different content types use specialized prompts"
         )
 
-        for enum_val, display_name in content_types.items():
-            if display_name == selected_display:
-                return ContentType(enum_val)
-
-        return ContentType.EDUCATIONAL
+        return _CONTENT_TYPE_BY_LABEL.get(selected_display, ContentType.EDUCATIONAL)
 
     # ── INPUT SECTION ─────────────────────────────────────────────────────
 
@@ -199,33 +201,23 @@ class UIComponents:
 
         with col1:
             st.markdown("**Tone:**")
-            tones = get_tones()
             selected_tone_display = st.selectbox(
                 "Choose tone:",
-                options=list(tones.values()),
+                options=_TONE_LABELS,
                 index=0,
                 label_visibility="collapsed"
             )
-            tone = Tone.PROFESSIONAL
-            for enum_val, display_name in tones.items():
-                if display_name == selected_tone_display:
-                    tone = Tone(enum_val)
-                    break
+            tone = _TONE_BY_LABEL.get(selected_tone_display, Tone.PROFESSIONAL)
 
         with col2:
             st.markdown("**Audience:**")
-            audiences = get_audiences()
             selected_audience_display = st.selectbox(
                 "Target audience:",
-                options=list(audiences.values()),
+                options=_AUDIENCE_LABELS,
                 index=2,
                 label_visibility="collapsed"
             )
-            audience = Audience.PROFESSIONALS
-            for enum_val, display_name in audiences.items():
-                if display_name == selected_audience_display:
-                    audience = Audience(enum_val)
-                    break
+            audience = _AUDIENCE_BY_LABEL.get(selected_audience_display, Audience.PROFESSIONALS)
 
         return tone, audience
 
@@ -301,6 +293,10 @@ class UIComponents:
                 include_caption = st.checkbox("Include Caption", value=False)
             with col2:
                 max_length = st.slider("Max Length", 500, 3000, 2000, 100)
+                no_cache = st.checkbox(
+                    "🚫 Do not cache", value=False,
+                    help="Always generate fresh and keep this post out of the response cache"
+                )
 
             st.markdown('<p style="font-family:\'Plus Jakarta Sans\',sans-serif;font-weight:700;font-size:0.95rem;margin:0.8rem 0 0.4rem 0;">🎯 Quality Improvements</p>', unsafe_allow_html=True)
 
@@ -312,7 +308,7 @@ class UIComponents:
                 )
                 show_quality_score = st.checkbox(
                     "📊 Show Quality Score", value=True,
-                    help="Display quality metrics"
+                    help="Offer an on-demand quality analysis under the post"
                 )
             with col4:
                 generate_hook_options_flag = st.checkbox(
@@ -331,7 +327,8 @@ class UIComponents:
             "enforce_specificity": enforce_specificity_flag,
             "show_quality_score": show_quality_score,
             "generate_hook_options": generate_hook_options_flag,
-            "ground_claims": ground_claims
+            "ground_claims": ground_claims,
+            "no_cache": no_cache,
         }
 
     # ── GENERATE BUTTON ───────────────────────────────────────────────────
@@ -350,6 +347,35 @@ class UIComponents:
 
     # ── POST OUTPUT ───────────────────────────────────────────────────────
 
+    @staticmethod
+    def render_quality_analysis(score_data):
+        """Render a quality score: per-metric tiles for a dict, the scorer's report otherwise."""
+        if not isinstance(score_data, dict):
+            st.markdown(str(score_data))
+            return
+
+        metrics = list(score_data.items())
+        cols = st.columns(min(len(metrics), 3))
+        for idx, (metric, value) in enumerate(metrics[:3]):
+            with cols[idx]:
+                try:
+                    nv = float(str(value).split('/')[0]) if '/' in str(value) else float(value)
+                    icon = "🟢" if nv >= 7 else "🟡" if nv >= 5 else "🔴"
+                    st.metric(metric.replace('_', ' ').title(), f"{icon} {value}")
+                except Exception:
+                    st.metric(metric.replace('_', ' ').title(), value)
+
+        if len(metrics) > 3:
+            cols2 = st.columns(2)
+            for idx, (metric, value) in enumerate(metrics[3:]):
+                with cols2[idx % 2]:
+                    try:
+                        nv = float(str(value).split('/')[0]) if '/' in str(value) else float(value)
+                        icon = "🟢" if nv >= 7 else "🟡" if nv >= 5 else "🔴"
+                        st.metric(metric.replace('_', ' ').title(), f"{icon} {value}")
+                    except Exception:
+                        st.metric(metric.replace('_', ' ').title(), value)
+
     @staticmethod
     def render_post_output(response):
         """Render generated post with fully-working action buttons."""
@@ -374,37 +400,6 @@ class UIComponents:
         with col3:
             st.metric("🏆 Hook", response.hook_strength.title())
 
-        # ── Quality Score Section ──
-        if hasattr(response, 'quality_score') and response.quality_score:
-            st.markdown("---")
-            st.markdown(f"""
-            <h3 class="gradient-title gradient-title-sm"><span class="gt-icon">📊</span> Quality Analysis</h3>
-            """, unsafe_allow_html=True)
-
-            score_data = response.quality_score
-            if isinstance(score_data, dict):
-                metrics = list(score_data.items())
-                cols = st.columns(min(len(metrics), 3))
-                for idx, (metric, value) in enumerate(metrics[:3]):
-                    with cols[idx]:
-                        try:
-                            nv = float(str(value).split('/')[0]) if '/' in str(value) else float(value)
-                            icon = "🟢" if nv >= 7 else "🟡" if nv >= 5 else "🔴"
-                            st.metric(metric.replace('_', ' ').title(), f"{icon} {value}")
-                        except Exception:
-                            st.metric(metric.replace('_', ' ').title(), value)
-
-                if len(metrics) > 3:
-                    cols2 = st.columns(2)
-                    for idx, (metric, value) in enumerate(metrics[3:]):
-                        with cols2[idx % 2]:
-                            try:
-                                nv = float(str(value).split('/')[0]) if '/' in str(value) else float(value)
-                                icon = "🟢" if nv >= 7 else "🟡" if nv >= 5 else "🔴"
-                                st.metric(metric.replace('_', ' ').title(), f"{icon} {value}")
-                            except Exception:
-                                st.metric(metric.replace('_', ' ').title(), value)
-
         # ── Hook Options ──
         if hasattr(response, 'hook_options') and response.hook_options:
             st.markdown("---")
@@ -473,7 +468,9 @@ class UIComponents:
         # 5 — Regenerate
         with btn_cols[4]:
             if st.button("🔄 Regenerate", key="btn_regen", use_container_width=True):
-                st.session_state.current_response = None
+                # Only this panel's state is reset; the next generation skips the
+                # response cache so it returns a fresh post, not the cached one
+                st.session_state.update({"current_response": None, "bypass_response_cache": True})
                 st.rerun()
 
         # ── LinkedIn Posting ──
@@ -618,7 +615,7 @@ class UIComponents:
                 </div>
                 """, unsafe_allow_html=True)
             else:
-                for i, item in enumerate(history[-5:]):
+                for i, item in enumerate(list(history)[-5:]):
                     st.markdown(f"""
                     <div style="padding:8px 10px;margin:4px 0;border-radius:10px;
                                 border:1px solid {T.SURFACE_BORDER};background:{T.SURFACE};
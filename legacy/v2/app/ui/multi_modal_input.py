@@ -8,6 +8,7 @@ with bold styling, gradient headers, and polished cards.
 import streamlit as st
 from typing import Dict, List, Optional
 from pathlib import Path
+import hashlib
 import tempfile
 import os
 
@@ -165,14 +166,21 @@ def render_multi_modal_input() -> Optional[Dict]:
 
 
 def _save_uploads(files, prefix: str) -> List[str]:
-    """Save Streamlit uploaded files to temp directory, return paths."""
+    """
+    Save Streamlit uploaded files to temp directory, return paths.
+    Files are named by content hash, so resubmitting the same upload reuses
+    the file already on disk instead of writing it again.
+    """
     if not files:
         return []
     paths = []
     tmp_dir = Path(tempfile.gettempdir()) / "agentic_studio"
     tmp_dir.mkdir(exist_ok=True)
     for f in files:
-        dest = tmp_dir / f"{prefix}_{f.name}"
-        dest.write_bytes(f.read())
+        data = f.getvalue()  # whole buffer, independent of any earlier read()
+        digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+        dest = tmp_dir / f"{prefix}_{digest}_{f.name}"
+        if not dest.exists():
+            dest.write_bytes(data)
         paths.append(str(dest))
     return paths
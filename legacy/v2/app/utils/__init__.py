@@ -25,6 +25,7 @@ from .cache import (
     get_cache,
     clear_cache
 )
+from .http import get_session
 
 __all__ = [
     'get_logger',
@@ -44,5 +45,6 @@ __all__ = [
     'SimpleCache',
     'cache_result',
     'get_cache',
-    'clear_cache'
+    'clear_cache',
+    'get_session'
 ]
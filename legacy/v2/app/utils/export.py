@@ -233,8 +233,9 @@ class PostDiffViewer:
             summary.append("🎣 Hook updated")
         
         # Check for emoji changes
-        original_emojis = len([c for c in original if ord(c) > 127])
-        refined_emojis = len([c for c in refined if ord(c) > 127])
+        # Non-ASCII characters, counted in C: ASCII survives an "ignore" encode
+        original_emojis = len(original) - len(original.encode("ascii", "ignore"))
+        refined_emojis = len(refined) - len(refined.encode("ascii", "ignore"))
         if refined_emojis > original_emojis:
             summary.append(f"😊 Added {refined_emojis - original_emojis} emojis")
         
@@ -0,0 +1,35 @@
+"""
+HTTP Session - Shared Connection Pool
+=====================================
+One keep-alive requests.Session for every outbound HTTP call
+(GitHub loaders, web scraper).
+"""
+
+import threading
+
+# Connections kept alive per host by the shared session
+HTTP_POOL_SIZE = 16
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Process-wide requests.Session so TCP/TLS connections are reused across calls.
+
+    Raises:
+        ImportError: If requests is not installed
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests  # type: ignore
+                from requests.adapters import HTTPAdapter  # type: ignore
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
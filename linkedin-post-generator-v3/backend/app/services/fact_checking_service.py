@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 from app.services.llm_service import LLMService
@@ -60,11 +61,11 @@ class FactCheckingService:
         claims = await self._extract_claims(post)
         
         # Step 2: Verify each claim (simplified - in production use web search)
-        verification_results = []
-        for claim in claims:
-            # For now, use LLM to verify (in production, use Tavily + RAG)
-            result = await self._verify_claim_with_llm(claim)
-            verification_results.append(result)
+        # For now, use LLM to verify (in production, use Tavily + RAG).
+        # Claims are independent, so the checks run concurrently.
+        verification_results = list(await asyncio.gather(
+            *(self._verify_claim_with_llm(claim) for claim in claims)
+        ))
         
         # Step 3: Flag problematic claims
         flagged = [r for r in verification_results if not r.is_verified]
@@ -55,7 +55,7 @@ class GenerationService:
                 HumanMessage(content=customized_prompt)
             ]
             
-            response = self.llm.invoke(messages)
+            response = await self.llm.ainvoke(messages)
             post_content = response.content
             
             # STEP 4: Extract hashtags
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 from app.services.llm_service import LLMService
@@ -54,12 +55,14 @@ class UserProfilingService:
         if not high_quality_posts:
             return StyleProfile.default(user_id)
         
-        # Analyze various style dimensions
-        tone = await self._extract_tone(high_quality_posts)
-        vocabulary = await self._extract_vocabulary_level(high_quality_posts)
-        structure = await self._extract_sentence_structure(high_quality_posts)
-        personality = await self._extract_personality(high_quality_posts)
-        themes = await self._extract_core_themes(high_quality_posts)
+        # Analyze various style dimensions (independent LLM calls, run concurrently)
+        tone, vocabulary, structure, personality, themes = await asyncio.gather(
+            self._extract_tone(high_quality_posts),
+            self._extract_vocabulary_level(high_quality_posts),
+            self._extract_sentence_structure(high_quality_posts),
+            self._extract_personality(high_quality_posts),
+            self._extract_core_themes(high_quality_posts),
+        )
         
         style = StyleProfile(
             user_id=user_id,
@@ -142,7 +142,7 @@ Return ONLY valid JSON in this exact format, nothing else:
 }}
 """
         try:
-            resp = _fast_llm().invoke([
+            resp = await _fast_llm().ainvoke([
                 SystemMessage(content="Extract structured memory from posts. Return only JSON."),
                 HumanMessage(content=extraction_prompt),
             ])
@@ -259,7 +259,7 @@ HOOK INSTRUCTION:
 Write only the post. Start immediately.
 """
 
-    resp = _fast_llm().invoke([
+    resp = await _fast_llm().ainvoke([
         SystemMessage(content="You are a human LinkedIn ghostwriter. Never sound like AI."),
         HumanMessage(content=prompt),
     ])
@@ -325,7 +325,7 @@ Return ONLY valid JSON:
 """
 
     try:
-        resp = _smart_llm().invoke([
+        resp = await _smart_llm().ainvoke([
             SystemMessage(content="You are a strict human-writing editor. Return only JSON."),
             HumanMessage(content=prompt),
         ])
@@ -404,7 +404,7 @@ RULES FOR REWRITE:
 Write only the improved post. No commentary.
 """
 
-    resp = _fast_llm().invoke([
+    resp = await _fast_llm().ainvoke([
         SystemMessage(content="Rewrite to sound more human. Keep what works. Fix what doesn't."),
         HumanMessage(content=prompt),
     ])
@@ -477,7 +477,7 @@ POST:
 Return only the polished post with hashtags. No commentary.
 """
 
-    resp = _smart_llm().invoke([
+    resp = await _smart_llm().ainvoke([
         SystemMessage(content="Light polish only. Preserve human voice. Return only the post."),
         HumanMessage(content=polish_prompt),
     ])